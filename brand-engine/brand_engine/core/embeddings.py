@@ -13,6 +13,8 @@ Cohere access supports two backends:
 
 import logging
 import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional, Union
 
@@ -24,6 +26,7 @@ from PIL import Image
 # (some JK lifestyle shots are 100M+ pixels — valid, not malicious)
 Image.MAX_IMAGE_PIXELS = None
 
+from brand_engine.core.io_pool import get_io_pool
 from brand_engine.core.models import EmbeddingResult
 
 logger = logging.getLogger(__name__)
@@ -66,6 +69,10 @@ class EmbeddingClient:
     COHERE_INPUT_TYPE_SEARCH_QUERY = "search_query"
     GEMINI_CAPTION_MODEL = "gemini-2.5-flash"
 
+    # Retrieval query texts repeat heavily (the worker grades every image
+    # against the same default query), so query embeddings are memoized.
+    QUERY_CACHE_SIZE = 128
+
     def __init__(self):
         """Initialize API clients from environment variables.
 
@@ -81,6 +88,9 @@ class EmbeddingClient:
             )
         self._genai_client = genai.Client(api_key=google_api_key)
 
+        self._query_cache: OrderedDict[str, EmbeddingResult] = OrderedDict()
+        self._query_cache_lock = threading.Lock()
+
         # Cohere — prefer Bedrock, fall back to direct API
         self._cohere_client: Union[cohere.BedrockClient, cohere.Client]
         self._cohere_model: str
@@ -132,13 +142,16 @@ class EmbeddingClient:
             EmbeddingResult with gemini_768 and cohere_1536 vectors.
         """
         image_path = str(Path(image_path).resolve())
+        # Read + decode once; both Gemini calls below share the pixels.
+        img = self._load_image(image_path)
 
-        # Gemini: embed image directly
-        gemini_vec = self._embed_image_gemini(image_path)
+        # Gemini: embed image directly (overlapped with the Cohere path)
+        gemini_future = get_io_pool().submit(self._embed_image_gemini, img)
 
         # Cohere: caption → embed
-        caption = self._caption_image(image_path)
+        caption = self._caption_image(img, image_path)
         cohere_vec = self._embed_text_cohere(caption, self.COHERE_INPUT_TYPE_SEARCH_DOC)
+        gemini_vec = gemini_future.result()
 
         return EmbeddingResult(gemini_768=gemini_vec, cohere_1536=cohere_vec)
 
@@ -151,20 +164,39 @@ class EmbeddingClient:
                       If False, use search_document (for indexing).
 
         Returns:
-            EmbeddingResult with gemini_768 and cohere_1536 vectors.
+            EmbeddingResult with gemini_768 and cohere_1536 vectors. Query
+            results are served from an LRU cache on repeat — treat them as
+            read-only.
         """
-        gemini_vec = self._embed_text_gemini(text)
+        if is_query:
+            with self._query_cache_lock:
+                cached = self._query_cache.get(text)
+                if cached is not None:
+                    self._query_cache.move_to_end(text)
+                    return cached
+
+        # Gemini and Cohere are independent API calls — overlap them
+        gemini_future = get_io_pool().submit(self._embed_text_gemini, text)
 
         cohere_input_type = (
             self.COHERE_INPUT_TYPE_SEARCH_QUERY if is_query else self.COHERE_INPUT_TYPE_SEARCH_DOC
         )
         cohere_vec = self._embed_text_cohere(text, cohere_input_type)
+        gemini_vec = gemini_future.result()
 
-        return EmbeddingResult(gemini_768=gemini_vec, cohere_1536=cohere_vec)
+        result = EmbeddingResult(gemini_768=gemini_vec, cohere_1536=cohere_vec)
+
+        if is_query:
+            with self._query_cache_lock:
+                self._query_cache[text] = result
+                if len(self._query_cache) > self.QUERY_CACHE_SIZE:
+                    self._query_cache.popitem(last=False)
+
+        return result
 
     def embed_image_gemini_only(self, image_path: str) -> list[float]:
         """Embed image with Gemini only (for fast visual-only queries)."""
-        return self._embed_image_gemini(str(Path(image_path).resolve()))
+        return self._embed_image_gemini(self._load_image(str(Path(image_path).resolve())))
 
     def embed_text_gemini_only(self, text: str) -> list[float]:
         """Embed text with Gemini only."""
@@ -172,10 +204,19 @@ class EmbeddingClient:
 
     # ---- Internal methods ----
 
-    def _embed_image_gemini(self, image_path: str) -> list[float]:
-        """Embed an image using Gemini Embedding 2 with MRL at 768D."""
+    @staticmethod
+    def _load_image(image_path: str) -> Image.Image:
+        """Open and fully decode an image.
+
+        Decoding eagerly (rather than PIL's lazy open) means the same object
+        can be handed to concurrent readers without either triggering a load.
+        """
         img = Image.open(image_path)
+        img.load()
+        return img
 
+    def _embed_image_gemini(self, img: Image.Image) -> list[float]:
+        """Embed an image using Gemini Embedding 2 with MRL at 768D."""
         # TODO(PR #5 cost ledger): emit an embedding ledger row from the os-api
         # caller once client_id/run_id context is threaded through brand-engine.
         # This low-level client intentionally has no tenant context.
@@ -213,13 +254,11 @@ class EmbeddingClient:
         )
         return result.embeddings.float_[0]
 
-    def _caption_image(self, image_path: str) -> str:
+    def _caption_image(self, img: Image.Image, image_path: str) -> str:
         """Generate a text caption for an image using Gemini Flash.
 
         This caption is used as input to Cohere (which is text-only).
         """
-        img = Image.open(image_path)
-
         response = self._genai_client.models.generate_content(
             model=self.GEMINI_CAPTION_MODEL,
             contents=[
@@ -10,6 +10,7 @@ from typing import Callable, Optional
 
 from brand_engine.core.analyzer import ImageAnalyzer
 from brand_engine.core.embeddings import EmbeddingClient, get_embedding_client
+from brand_engine.core.io_pool import get_io_pool
 from brand_engine.core.models import (
     BrandProfile,
     GradeResult,
@@ -71,6 +72,16 @@ class BrandGrader:
         self._log("grading", "info", f"Grading image: {image_path}")
         self._log("grading", "info", f"Brand: {profile.brand_slug}, tier: {index_tier}")
 
+        # Pixel analysis is local and independent of retrieval — start it
+        # now so it runs under the embedding/Pinecone round-trips.
+        pixel_future = None
+        if include_pixel_analysis:
+            pixel_future = get_io_pool().submit(
+                self._analyzer.analyze,
+                image_path=image_path,
+                brand_palette=profile.allowed_colors or None,
+            )
+
         # 1. Dual-fusion retrieval
         self._log("grading", "info", "Running dual-fusion retrieval (Gemini + Cohere)...")
         fusion = self._retriever.retrieve(
@@ -91,12 +102,9 @@ class BrandGrader:
 
         # 2. Pixel analysis (optional)
         pixel = None
-        if include_pixel_analysis:
-            self._log("grading", "info", "Running pixel analysis...")
-            pixel = self._analyzer.analyze(
-                image_path=image_path,
-                brand_palette=profile.allowed_colors or None,
-            )
+        if pixel_future is not None:
+            self._log("grading", "info", "Collecting pixel analysis...")
+            pixel = pixel_future.result()
 
             self._log(
                 "grading",
@@ -7,10 +7,14 @@ Replaces CLIP+E5 with Gemini Embedding 2. Cohere ingestion preserved.
 import hashlib
 import logging
 import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 from typing import Callable, Optional
 
 from brand_engine.core.embeddings import EmbeddingClient, get_embedding_client
+from brand_engine.core.io_pool import get_io_pool
 from brand_engine.core.models import BrandProfile, IngestResult
 from brand_engine.core.pinecone_client import get_index
 
@@ -19,6 +23,10 @@ logger = logging.getLogger(__name__)
 IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp", ".bmp", ".tiff"}
 DOCUMENT_EXTENSIONS = {".pdf", ".md", ".txt", ".docx"}
 BATCH_SIZE = 50
+# Images embedded concurrently during ingest. Each embed_image is a handful
+# of remote calls (Gemini, caption, Cohere), so a serial loop spends nearly
+# all its time waiting; this bounds the in-flight embeds per ingest.
+DEFAULT_EMBED_CONCURRENCY = 4
 
 
 class BrandIndexer:
@@ -78,6 +86,22 @@ class BrandIndexer:
 
         self._log("ingest", "info", f"Found {len(image_files)} images in {images_dir}")
 
+        # Vector IDs derive from brand + file name, so same-named files (e.g.
+        # the same asset reached through two symlinked folders) would all
+        # upsert to one ID and only the last would survive. Embed just that
+        # one instead of paying Gemini + Cohere for each copy.
+        by_vec_id = {
+            self._make_vector_id(profile.brand_slug, img_path): img_path
+            for img_path in image_files
+        }
+        if len(by_vec_id) < len(image_files):
+            self._log(
+                "ingest",
+                "info",
+                f"Skipping {len(image_files) - len(by_vec_id)} duplicate file name(s)",
+            )
+        image_files = list(by_vec_id.values())
+
         vectors_indexed = 0
         errors = []
 
@@ -85,47 +109,67 @@ class BrandIndexer:
         gemini_batch = []
         cohere_batch = []
 
-        for i, img_path in enumerate(image_files):
-            try:
-                self._log(
-                    "ingest",
-                    "info",
-                    f"Embedding [{i+1}/{len(image_files)}]: {img_path.name}",
-                )
-
-                result = self._embed.embed_image(str(img_path))
-
-                # Generate a stable vector ID from file path
-                vec_id = self._make_vector_id(profile.brand_slug, img_path)
-
-                metadata = {
-                    "brand": profile.brand_slug,
-                    "filename": img_path.name,
-                    "source_path": str(img_path),
-                    "tier": index_tier,
-                }
-
-                gemini_batch.append((vec_id, result.gemini_768, metadata))
-                cohere_batch.append((vec_id, result.cohere_1536, metadata))
-
-                # Flush when batch is full
-                if len(gemini_batch) >= BATCH_SIZE:
-                    self._upsert_batch(gemini_index, gemini_batch)
-                    self._upsert_batch(cohere_index, cohere_batch)
-                    vectors_indexed += len(gemini_batch)
-                    gemini_batch.clear()
-                    cohere_batch.clear()
+        # Embeds run ahead on their own pool (not the shared I/O pool —
+        # embed_image waits on that one internally) while this thread
+        # collects results in file order and upserts full batches, so
+        # upserts overlap the next batch's embedding.
+        concurrency = int(os.getenv("BRAND_ENGINE_EMBED_CONCURRENCY", DEFAULT_EMBED_CONCURRENCY))
+        embed_pool = ThreadPoolExecutor(
+            max_workers=max(1, concurrency), thread_name_prefix="brand-engine-embed"
+        )
 
-            except Exception as e:
-                error_msg = f"Error embedding {img_path.name}: {e}"
-                logger.warning(error_msg)
-                errors.append(error_msg)
-                self._log("ingest", "warn", error_msg)
+        def submit(path: Path):
+            return path, embed_pool.submit(self._embed.embed_image, str(path))
+
+        try:
+            # Keep about two embeds queued per worker: enough to stay busy
+            # without holding a future (and its vectors) for every image.
+            remaining = iter(image_files)
+            in_flight = deque(map(submit, islice(remaining, 2 * max(1, concurrency))))
+            for i in range(len(image_files)):
+                img_path, future = in_flight.popleft()
+                next_path = next(remaining, None)
+                if next_path is not None:
+                    in_flight.append(submit(next_path))
+                try:
+                    result = future.result()
+                    self._log(
+                        "ingest",
+                        "info",
+                        f"Embedded [{i+1}/{len(image_files)}]: {img_path.name}",
+                    )
+
+                    # Stable vector ID from brand + file name
+                    vec_id = self._make_vector_id(profile.brand_slug, img_path)
+
+                    metadata = {
+                        "brand": profile.brand_slug,
+                        "filename": img_path.name,
+                        "source_path": str(img_path),
+                        "tier": index_tier,
+                    }
+
+                    gemini_batch.append((vec_id, result.gemini_768, metadata))
+                    cohere_batch.append((vec_id, result.cohere_1536, metadata))
+
+                    # Flush when batch is full
+                    if len(gemini_batch) >= BATCH_SIZE:
+                        self._upsert_pair(gemini_index, cohere_index, gemini_batch, cohere_batch)
+                        vectors_indexed += len(gemini_batch)
+                        gemini_batch.clear()
+                        cohere_batch.clear()
+
+                except Exception as e:
+                    error_msg = f"Error embedding {img_path.name}: {e}"
+                    logger.warning(error_msg)
+                    errors.append(error_msg)
+                    self._log("ingest", "warn", error_msg)
+        finally:
+            embed_pool.shutdown(wait=True, cancel_futures=True)
 
         # Flush remaining
         if gemini_batch:
-            self._upsert_batch(gemini_index, gemini_batch)
-            self._upsert_batch(cohere_index, cohere_batch)
+            self._upsert_pair(gemini_index, cohere_index, gemini_batch, cohere_batch)
             vectors_indexed += len(gemini_batch)
 
         # Index documents if provided
@@ -208,8 +252,7 @@ class BrandIndexer:
                     cohere_batch.append((vec_id, result.cohere_1536, metadata))
 
                     if len(gemini_batch) >= BATCH_SIZE:
-                        self._upsert_batch(gemini_index, gemini_batch)
-                        self._upsert_batch(cohere_index, cohere_batch)
+                        self._upsert_pair(gemini_index, cohere_index, gemini_batch, cohere_batch)
                         count += len(gemini_batch)
                         gemini_batch.clear()
                         cohere_batch.clear()
@@ -220,12 +263,23 @@ class BrandIndexer:
                 self._log("ingest", "warn", error_msg)
 
         if gemini_batch:
-            self._upsert_batch(gemini_index, gemini_batch)
-            self._upsert_batch(cohere_index, cohere_batch)
+            self._upsert_pair(gemini_index, cohere_index, gemini_batch, cohere_batch)
             count += len(gemini_batch)
 
         return count
 
+    def _upsert_pair(self, gemini_index, cohere_index, gemini_batch, cohere_batch) -> None:
+        """Upsert matching Gemini and Cohere batches concurrently — Gemini on
+        the I/O pool, Cohere on this thread."""
+        gemini_future = get_io_pool().submit(self._upsert_batch, gemini_index, gemini_batch)
+        try:
+            self._upsert_batch(cohere_index, cohere_batch)
+        finally:
+            # Always wait: the caller reuses gemini_batch once we return
+            gemini_error = gemini_future.exception()
+        if gemini_error is not None:
+            raise gemini_error
+
     def _upsert_batch(self, index, batch: list[tuple]) -> None:
         """Upsert a batch of vectors to a Pinecone index."""
         vectors = [(vid, vec, meta) for vid, vec, meta in batch]
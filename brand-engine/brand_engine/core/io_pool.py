@@ -0,0 +1,38 @@
+"""Shared thread pool for brand-engine's outbound I/O.
+
+Gemini, Cohere, and Pinecone calls are network-bound, so independent calls
+(e.g. the Gemini and Cohere halves of one embedding, or the two index
+queries in a retrieval) are overlapped on this pool. One process-wide pool
+means concurrent grades/ingests share a bounded set of threads instead of
+each building and tearing down its own executor.
+
+Callers keep one of the overlapped calls on their own thread, so a
+saturated pool delays work but can never deadlock.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+DEFAULT_IO_WORKERS = 16
+
+_pool: Optional[ThreadPoolExecutor] = None
+_lock = threading.Lock()
+
+
+def get_io_pool() -> ThreadPoolExecutor:
+    """Get or create the singleton I/O pool.
+
+    Sized by BRAND_ENGINE_IO_WORKERS (default 16) — deliberately above
+    cpu_count, since workers spend their time waiting on the network.
+    """
+    global _pool
+    if _pool is None:
+        with _lock:
+            if _pool is None:
+                workers = int(os.getenv("BRAND_ENGINE_IO_WORKERS", DEFAULT_IO_WORKERS))
+                _pool = ThreadPoolExecutor(
+                    max_workers=max(1, workers), thread_name_prefix="brand-engine-io"
+                )
+    return _pool
@@ -2,7 +2,7 @@
 
 import logging
 import os
-from typing import Optional
+from typing import Any, Optional
 
 from pinecone import Pinecone
 
@@ -10,6 +10,11 @@ logger = logging.getLogger(__name__)
 
 _instance: Optional[Pinecone] = None
 
+# Index handles by name. Each pc.Index() resolves the index host and builds
+# its own HTTP connection pool, so reusing handles keeps connections warm
+# across every retrieve/ingest call in a long-lived process.
+_indexes: dict[str, Any] = {}
+
 
 def get_pinecone_client() -> Pinecone:
     """Get or create the singleton Pinecone client."""
@@ -24,9 +29,12 @@ def get_pinecone_client() -> Pinecone:
 
 
 def get_index(index_name: str):
-    """Get a Pinecone index by name."""
-    pc = get_pinecone_client()
-    return pc.Index(index_name)
+    """Get a (cached) Pinecone index handle by name."""
+    index = _indexes.get(index_name)
+    if index is None:
+        pc = get_pinecone_client()
+        index = _indexes.setdefault(index_name, pc.Index(index_name))
+    return index
 
 
 def check_connectivity() -> bool:
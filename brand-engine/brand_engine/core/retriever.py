@@ -9,12 +9,15 @@ Z-score normalization logic preserved from original.
 
 import json
 import logging
+import os
+import threading
 from pathlib import Path
 from typing import Optional
 
 import numpy as np
 
 from brand_engine.core.embeddings import EmbeddingClient, get_embedding_client
+from brand_engine.core.io_pool import get_io_pool
 from brand_engine.core.models import (
     BrandProfile,
     BrandThresholds,
@@ -25,6 +28,12 @@ from brand_engine.core.pinecone_client import get_index
 
 logger = logging.getLogger(__name__)
 
+# Parsed profiles keyed by file path, with the mtime they were read at.
+# Every grade/ingest loads its brand's profile; re-reading and validating
+# the JSON is skipped until the file actually changes on disk.
+_PROFILE_CACHE: dict[str, tuple[int, BrandProfile]] = {}
+_PROFILE_CACHE_LOCK = threading.Lock()
+
 
 class DualFusionRetriever:
     """Queries Pinecone with both Gemini and Cohere embeddings,
@@ -85,13 +94,15 @@ class DualFusionRetriever:
         else:
             embeddings = self._embed.embed_image(image_path)
 
-        # Query both indexes
-        gemini_score = self._query_index(
-            gemini_index_name, embeddings.gemini_768, "gemini", top_k
+        # Query both indexes concurrently — Gemini on the pool, Cohere on
+        # this thread (so a saturated pool can never deadlock a caller)
+        gemini_future = get_io_pool().submit(
+            self._query_index, gemini_index_name, embeddings.gemini_768, "gemini", top_k
         )
         cohere_score = self._query_index(
             cohere_index_name, embeddings.cohere_1536, "cohere", top_k
         )
+        gemini_score = gemini_future.result()
 
         # Extract per-model baseline stats if provided
         gemini_mean = baseline_stats.get("baseline_gemini_raw") if baseline_stats else None
@@ -145,7 +156,9 @@ class DualFusionRetriever:
         """Query a single Pinecone index and return the modal score."""
         index = get_index(index_name)
 
-        results = index.query(vector=vector, top_k=top_k, include_metadata=True)
+        # Only match ids and scores feed the fusion, so skip the per-match
+        # metadata (and values) payload entirely.
+        results = index.query(vector=vector, top_k=top_k, include_metadata=False)
 
         if not results.matches:
             logger.warning("No matches in index %s", index_name)
@@ -214,6 +227,9 @@ class DualFusionRetriever:
 def load_brand_profile(brand_slug: str, profiles_dir: Optional[str] = None) -> BrandProfile:
     """Load a brand profile from JSON file.
 
+    Profiles are cached per path and re-read only when the file's mtime
+    changes, so callers share one instance and must treat it as read-only.
+
     Args:
         brand_slug: Brand identifier (e.g., 'jennikayne', 'cylndr').
         profiles_dir: Directory containing profile JSONs. Defaults to
@@ -224,12 +240,22 @@ def load_brand_profile(brand_slug: str, profiles_dir: Optional[str] = None) -> B
             Path(__file__).parent.parent.parent / "data" / "brand_profiles"
         )
 
-    profile_path = Path(profiles_dir) / f"{brand_slug}.json"
+    profile_path = os.path.join(profiles_dir, f"{brand_slug}.json")
+
+    try:
+        mtime = os.stat(profile_path).st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Brand profile not found: {profile_path}") from None
 
-    if not profile_path.exists():
-        raise FileNotFoundError(f"Brand profile not found: {profile_path}")
+    with _PROFILE_CACHE_LOCK:
+        cached = _PROFILE_CACHE.get(profile_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
 
     with open(profile_path) as f:
         data = json.load(f)
 
-    return BrandProfile(**data)
+    profile = BrandProfile(**data)
+    with _PROFILE_CACHE_LOCK:
+        _PROFILE_CACHE[profile_path] = (mtime, profile)
+    return profile
@@ -0,0 +1,92 @@
+"""Coverage for EmbeddingClient's query-embedding LRU cache."""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from unittest.mock import MagicMock
+
+import pytest
+
+from brand_engine.core.embeddings import EmbeddingClient
+
+
+@pytest.fixture
+def client():
+    # Bypass __init__ (needs API keys); wire just what embed_text touches.
+    c = EmbeddingClient.__new__(EmbeddingClient)
+    c._query_cache = OrderedDict()
+    c._query_cache_lock = threading.Lock()
+    c._embed_text_gemini = MagicMock(side_effect=lambda text: [float(len(text))] * 4)
+    c._embed_text_cohere = MagicMock(side_effect=lambda text, _t: [1.0] * 4)
+    return c
+
+
+def test_repeat_query_skips_embedding_calls(client):
+    first = client.embed_text("natural light", is_query=True)
+    second = client.embed_text("natural light", is_query=True)
+
+    assert second is first
+    assert client._embed_text_gemini.call_count == 1
+    assert client._embed_text_cohere.call_count == 1
+
+
+def test_document_embeddings_are_not_cached(client):
+    client.embed_text("doc chunk", is_query=False)
+    client.embed_text("doc chunk", is_query=False)
+
+    assert client._embed_text_gemini.call_count == 2
+    assert not client._query_cache
+
+
+def test_cache_evicts_least_recently_used(client, monkeypatch):
+    monkeypatch.setattr(EmbeddingClient, "QUERY_CACHE_SIZE", 2)
+    client.embed_text("a", is_query=True)
+    client.embed_text("b", is_query=True)
+    client.embed_text("a", is_query=True)  # refresh "a"
+    client.embed_text("c", is_query=True)  # evicts "b"
+
+    assert list(client._query_cache) == ["a", "c"]
+
+
+def test_gemini_and_cohere_text_embeds_overlap(client):
+    # Each side waits for the other; only passes if they run concurrently.
+    barrier = threading.Barrier(2, timeout=5)
+
+    def gemini(text):
+        barrier.wait()
+        return [0.0] * 4
+
+    def cohere(text, _t):
+        barrier.wait()
+        return [1.0] * 4
+
+    client._embed_text_gemini = MagicMock(side_effect=gemini)
+    client._embed_text_cohere = MagicMock(side_effect=cohere)
+
+    result = client.embed_text("overlap", is_query=False)
+
+    assert result.gemini_768 == [0.0] * 4
+    assert result.cohere_1536 == [1.0] * 4
+
+
+def test_embed_image_decodes_file_once(client, tmp_path, monkeypatch):
+    from PIL import Image
+
+    path = tmp_path / "img.png"
+    Image.new("RGB", (4, 4), "white").save(path)
+
+    opened = []
+    real_open = Image.open
+    monkeypatch.setattr(
+        "brand_engine.core.embeddings.Image.open",
+        lambda *a, **k: opened.append(a[0]) or real_open(*a, **k),
+    )
+    client._embed_image_gemini = MagicMock(return_value=[0.0] * 4)
+    client._caption_image = MagicMock(return_value="a white square")
+
+    result = client.embed_image(str(path))
+
+    assert len(opened) == 1
+    shared = client._embed_image_gemini.call_args.args[0]
+    assert client._caption_image.call_args.args[0] is shared
+    assert result.cohere_1536 == [1.0] * 4
@@ -0,0 +1,82 @@
+"""Coverage for BrandGrader overlapping pixel analysis with retrieval."""
+from __future__ import annotations
+
+import threading
+from unittest.mock import MagicMock
+
+from brand_engine.core.grader import BrandGrader
+from brand_engine.core.models import (
+    BrandProfile,
+    BrandThresholds,
+    FusionResult,
+    ModalScore,
+    PixelAnalysis,
+)
+
+
+def _profile() -> BrandProfile:
+    return BrandProfile(
+        brand_slug="testbrand",
+        display_name="Test Brand",
+        indexes={},
+        thresholds=BrandThresholds(),
+    )
+
+
+def _fusion() -> FusionResult:
+    score = ModalScore(model="gemini", raw_score=0.8, z_score=1.0, top_k_ids=[])
+    return FusionResult(
+        gemini_score=score,
+        cohere_score=score.model_copy(update={"model": "cohere"}),
+        combined_z=1.0,
+        gate_decision="AUTO_PASS",
+        confidence=0.9,
+    )
+
+
+def _grader() -> BrandGrader:
+    grader = BrandGrader.__new__(BrandGrader)
+    grader._retriever = MagicMock()
+    grader._analyzer = MagicMock()
+    grader._log = lambda *_args: None
+    return grader
+
+
+def test_pixel_analysis_overlaps_retrieval():
+    # Each side waits for the other; only passes if they run concurrently.
+    barrier = threading.Barrier(2, timeout=5)
+    grader = _grader()
+
+    def retrieve(**_kwargs):
+        barrier.wait()
+        return _fusion()
+
+    def analyze(**_kwargs):
+        barrier.wait()
+        return PixelAnalysis(
+            saturation_mean=0.4,
+            saturation_std=0.1,
+            brightness_mean=0.6,
+            brightness_std=0.1,
+            whitespace_ratio=0.3,
+            clutter_score=0.1,
+            dominant_colors=["#ffffff"],
+        )
+
+    grader._retriever.retrieve.side_effect = retrieve
+    grader._analyzer.analyze.side_effect = analyze
+
+    result = grader.grade("img.png", _profile())
+
+    assert result.pixel.clutter_score == 0.1
+    assert result.gate_decision == "AUTO_PASS"
+
+
+def test_pixel_analysis_skipped_when_disabled():
+    grader = _grader()
+    grader._retriever.retrieve.return_value = _fusion()
+
+    result = grader.grade("img.png", _profile(), include_pixel_analysis=False)
+
+    grader._analyzer.analyze.assert_not_called()
+    assert result.pixel is None
@@ -0,0 +1,106 @@
+"""Coverage for BrandIndexer's image loop: dedup by vector ID, bounded concurrent embeds."""
+from __future__ import annotations
+
+import threading
+from unittest.mock import MagicMock, patch
+
+from brand_engine.core import indexer as indexer_module
+from brand_engine.core.indexer import BrandIndexer
+from brand_engine.core.models import BrandProfile, EmbeddingResult
+
+
+def _profile() -> BrandProfile:
+    return BrandProfile(
+        brand_slug="testbrand",
+        display_name="Test Brand",
+        indexes={
+            "brand-dna-gemini768": "test-gemini",
+            "brand-dna-cohere": "test-cohere",
+        },
+    )
+
+
+def test_same_named_files_are_embedded_once(tmp_path):
+    for folder in ("a", "b"):
+        (tmp_path / folder).mkdir()
+        (tmp_path / folder / "hero.png").write_bytes(b"png")
+    (tmp_path / "a" / "detail.jpg").write_bytes(b"jpg")
+
+    embed = MagicMock()
+    embed.embed_image.return_value = EmbeddingResult(
+        gemini_768=[0.1] * 768, cohere_1536=[0.1] * 1536
+    )
+    indexes = {"test-gemini": MagicMock(), "test-cohere": MagicMock()}
+
+    with patch.object(indexer_module, "get_index", side_effect=indexes.__getitem__):
+        result = BrandIndexer(embedding_client=embed).ingest(_profile(), str(tmp_path))
+
+    embedded = sorted(c.args[0] for c in embed.embed_image.call_args_list)
+    # The last same-named file wins, as it did when both were upserted
+    assert embedded == [str(tmp_path / "a" / "detail.jpg"), str(tmp_path / "b" / "hero.png")]
+    assert result.vectors_indexed == 2
+    vectors = indexes["test-gemini"].upsert.call_args.kwargs["vectors"]
+    assert len({vid for vid, _vec, _meta in vectors}) == 2
+
+
+def test_images_are_embedded_concurrently_and_upserted_in_order(tmp_path):
+    names = [f"img{i}.png" for i in range(4)]
+    for name in names:
+        (tmp_path / name).write_bytes(b"png")
+
+    # Two embeds must be in flight at once or the barrier times out
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fake_embed(path):
+        barrier.wait()
+        return EmbeddingResult(gemini_768=[0.1] * 768, cohere_1536=[0.1] * 1536)
+
+    embed = MagicMock()
+    embed.embed_image.side_effect = fake_embed
+    indexes = {"test-gemini": MagicMock(), "test-cohere": MagicMock()}
+
+    with patch.object(indexer_module, "get_index", side_effect=indexes.__getitem__):
+        result = BrandIndexer(embedding_client=embed).ingest(_profile(), str(tmp_path))
+
+    assert result.errors == []
+    assert result.vectors_indexed == 4
+    for index in indexes.values():
+        vectors = index.upsert.call_args.kwargs["vectors"]
+        assert [meta["filename"] for _vid, _vec, meta in vectors] == names
+
+
+def test_embeds_are_submitted_in_a_bounded_window(tmp_path, monkeypatch):
+    for i in range(10):
+        (tmp_path / f"img{i}.png").write_bytes(b"png")
+    monkeypatch.setenv("BRAND_ENGINE_EMBED_CONCURRENCY", "1")
+
+    lock = threading.Lock()
+    started = 0
+    peak_ahead = 0
+    indexed = []
+
+    def fake_embed(path):
+        nonlocal started
+        with lock:
+            started += 1
+        return EmbeddingResult(gemini_768=[0.1] * 768, cohere_1536=[0.1] * 1536)
+
+    def fake_log(stage, level, message):
+        nonlocal peak_ahead
+        if message.startswith("Embedded ["):
+            indexed.append(message)
+            with lock:
+                peak_ahead = max(peak_ahead, started - len(indexed))
+
+    embed = MagicMock()
+    embed.embed_image.side_effect = fake_embed
+    indexes = {"test-gemini": MagicMock(), "test-cohere": MagicMock()}
+
+    with patch.object(indexer_module, "get_index", side_effect=indexes.__getitem__):
+        result = BrandIndexer(embedding_client=embed, log_callback=fake_log).ingest(
+            _profile(), str(tmp_path)
+        )
+
+    assert result.vectors_indexed == 10
+    # Concurrency 1 keeps at most two embeds queued beyond the one consumed
+    assert peak_ahead <= 2
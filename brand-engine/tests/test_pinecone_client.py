@@ -0,0 +1,27 @@
+"""Coverage for pinecone_client.get_index handle caching."""
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from brand_engine.core import pinecone_client
+
+
+@pytest.fixture(autouse=True)
+def fake_pinecone(monkeypatch):
+    fake = MagicMock()
+    fake.Index.side_effect = lambda name: MagicMock(name=f"Index({name})")
+    monkeypatch.setattr(pinecone_client, "get_pinecone_client", lambda: fake)
+    monkeypatch.setattr(pinecone_client, "_indexes", {})
+    return fake
+
+
+def test_get_index_reuses_handle_per_name(fake_pinecone):
+    first = pinecone_client.get_index("jk-brand-dna-gemini768")
+    second = pinecone_client.get_index("jk-brand-dna-gemini768")
+    other = pinecone_client.get_index("jk-brand-dna-cohere")
+
+    assert first is second
+    assert other is not first
+    assert fake_pinecone.Index.call_count == 2
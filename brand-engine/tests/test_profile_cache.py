@@ -0,0 +1,40 @@
+"""Coverage for load_brand_profile's mtime-checked cache."""
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+from brand_engine.core.retriever import load_brand_profile
+
+
+def _write_profile(directory, display_name: str, mtime_ns: int) -> None:
+    path = directory / "testbrand.json"
+    path.write_text(json.dumps({
+        "brand_slug": "testbrand",
+        "display_name": display_name,
+        "indexes": {},
+    }))
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_unchanged_file_returns_cached_profile(tmp_path):
+    _write_profile(tmp_path, "Test Brand", 1_000_000_000)
+    first = load_brand_profile("testbrand", profiles_dir=str(tmp_path))
+    second = load_brand_profile("testbrand", profiles_dir=str(tmp_path))
+    assert second is first
+
+
+def test_modified_file_is_reloaded(tmp_path):
+    _write_profile(tmp_path, "Old Name", 1_000_000_000)
+    first = load_brand_profile("testbrand", profiles_dir=str(tmp_path))
+    _write_profile(tmp_path, "New Name", 2_000_000_000)
+    second = load_brand_profile("testbrand", profiles_dir=str(tmp_path))
+    assert first.display_name == "Old Name"
+    assert second.display_name == "New Name"
+
+
+def test_missing_profile_raises(tmp_path):
+    with pytest.raises(FileNotFoundError, match="Brand profile not found"):
+        load_brand_profile("nobrand", profiles_dir=str(tmp_path))
@@ -0,0 +1,49 @@
+"""Coverage for DualFusionRetriever running its two index queries concurrently."""
+from __future__ import annotations
+
+import threading
+from unittest.mock import MagicMock
+
+from brand_engine.core.models import (
+    BrandProfile,
+    BrandThresholds,
+    EmbeddingResult,
+    ModalScore,
+)
+from brand_engine.core.retriever import DualFusionRetriever
+
+
+def _profile() -> BrandProfile:
+    return BrandProfile(
+        brand_slug="testbrand",
+        display_name="Test Brand",
+        indexes={
+            "brand-dna-gemini768": "test-gemini",
+            "brand-dna-cohere": "test-cohere",
+        },
+        thresholds=BrandThresholds(),
+    )
+
+
+def test_gemini_and_cohere_queries_overlap():
+    embed = MagicMock()
+    embed.embed_text.return_value = EmbeddingResult(
+        gemini_768=[0.1] * 768, cohere_1536=[0.1] * 1536
+    )
+    retriever = DualFusionRetriever(embedding_client=embed)
+
+    # Each query waits for the other to start — a serial implementation
+    # would time out on the barrier.
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fake_query(index_name, vector, model_name, top_k):
+        barrier.wait()
+        return ModalScore(model=model_name, raw_score=0.6, z_score=0.0, top_k_ids=[])
+
+    retriever._query_index = fake_query
+    result = retriever.retrieve(
+        image_path="unused.png", profile=_profile(), text_query="natural light"
+    )
+
+    assert result.gemini_score.model == "gemini"
+    assert result.cohere_score.model == "cohere"
@@ -0,0 +1,47 @@
+-- 024_notify_pending_runs.sql
+-- Wake idle Python workers when a run becomes claimable.
+--
+-- Problem: worker.py polls `runs WHERE status = 'pending'` every
+--   POLL_INTERVAL_SECONDS (2s) per worker, forever. Idle workers generate a
+--   steady PostgREST query load, and every run waits up to one interval
+--   before pickup.
+--
+-- Fix: fire pg_notify('runs_pending', id) whenever a row enters 'pending'
+--   (INSERT, or an UPDATE of status to 'pending' such as a re-queue). Workers
+--   with SUPABASE_DB_URL set LISTEN on a direct connection and claim as soon
+--   as the inserting transaction commits; they fall back to a slow poll
+--   (POLL_FALLBACK_SECONDS) to cover notifications missed while reconnecting.
+--
+-- The payload is only a wake-up hint — workers still claim through the
+-- normal guarded path, so a notification for an os-api-owned mode (regrade,
+-- stills) just results in an empty claim. NOTIFY is transactional: nothing
+-- is delivered for rolled-back inserts.
+--
+-- Note: LISTEN needs a session-level connection (direct or session-mode
+-- pooler); Supavisor transaction mode does not deliver notifications.
+
+BEGIN;
+
+CREATE OR REPLACE FUNCTION notify_pending_run()
+RETURNS TRIGGER AS $$
+BEGIN
+  PERFORM pg_notify('runs_pending', NEW.id::text);
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS runs_notify_pending_insert ON runs;
+CREATE TRIGGER runs_notify_pending_insert
+  AFTER INSERT ON runs
+  FOR EACH ROW
+  WHEN (NEW.status = 'pending')
+  EXECUTE FUNCTION notify_pending_run();
+
+DROP TRIGGER IF EXISTS runs_notify_pending_update ON runs;
+CREATE TRIGGER runs_notify_pending_update
+  AFTER UPDATE OF status ON runs
+  FOR EACH ROW
+  WHEN (NEW.status = 'pending' AND OLD.status IS DISTINCT FROM 'pending')
+  EXECUTE FUNCTION notify_pending_run();
+
+COMMIT;
@@ -0,0 +1,53 @@
+-- 025_claim_next_run.sql
+-- Atomic run claim for the Python worker.
+--
+-- Problem (worker/worker.py::_claim_pending_run):
+--   The worker SELECTs the oldest pending run, then issues a conditional
+--   UPDATE ... WHERE status = 'pending'. That is two PostgREST round-trips
+--   per claim, and with several workers (or several claim slots per worker,
+--   MAX_CONCURRENT_RUNS) they all SELECT the same head-of-queue row; all but
+--   one UPDATE then match zero rows and the losers come back empty-handed
+--   even when more pending runs are queued behind it.
+--
+-- Fix: one statement that locks the oldest claimable row with
+--   FOR UPDATE SKIP LOCKED, flips it to 'running', and RETURNs it.
+--   Concurrent callers skip rows another transaction holds and take the
+--   next one instead of colliding. The worker falls back to the old
+--   SELECT + UPDATE path if this function is not deployed.
+--
+-- p_excluded_modes carries the worker's OS_API_OWNED_MODES (regrade,
+-- stills) so those rows are never claimed. mode is compared as text so the
+-- caller doesn't need to know the run_mode enum.
+
+BEGIN;
+
+CREATE OR REPLACE FUNCTION claim_next_run(
+  p_excluded_modes TEXT[] DEFAULT '{}'
+) RETURNS SETOF runs
+LANGUAGE sql
+SECURITY INVOKER
+AS $$
+  UPDATE runs
+  SET status = 'running',
+      started_at = NOW()
+  WHERE id = (
+    SELECT id
+    FROM runs
+    WHERE status = 'pending'
+      AND NOT (mode::text = ANY (p_excluded_modes))
+    ORDER BY created_at
+    LIMIT 1
+    FOR UPDATE SKIP LOCKED
+  )
+  RETURNING *;
+$$;
+
+COMMENT ON FUNCTION claim_next_run(TEXT[]) IS
+  'Atomically claim the oldest pending run not in p_excluded_modes '
+  '(SELECT ... FOR UPDATE SKIP LOCKED + UPDATE ... RETURNING). Used by '
+  'worker/worker.py::_claim_pending_run.';
+
+GRANT EXECUTE ON FUNCTION claim_next_run(TEXT[])
+  TO authenticated, service_role;
+
+COMMIT;
@@ -0,0 +1,46 @@
+-- 026_runs_status_timestamps.sql
+-- Stamp runs.started_at / completed_at server-side on worker status
+-- transitions that don't carry them.
+--
+-- Problem: started_at / completed_at are only as reliable as every writer
+--   remembering to send them. A status PATCH that omits the column (e.g.
+--   finalize_run, migration 028) leaves a finished run without a
+--   completed_at, and run durations in the HUD come out empty.
+--
+-- Fix: a BEFORE UPDATE OF status trigger fills the timestamp with NOW()
+--   when the UPDATE didn't set that column itself, on exactly the
+--   transitions worker.py stamps — pending -> running (started_at) and
+--   running -> completed / failed / cancelled / blocked (completed_at).
+--   Explicit timestamps always win, so the worker keeps sending its own
+--   and works with or without this migration. Other writers are left
+--   alone: os-api's HITL reject (needs_review -> blocked) deliberately
+--   sets no completedAt, and needs_review is never stamped.
+--
+-- "Didn't set" means the new value is unchanged from the old row — a PATCH
+-- that omits the column leaves NEW equal to OLD.
+
+BEGIN;
+
+CREATE OR REPLACE FUNCTION stamp_run_status_times()
+RETURNS TRIGGER AS $$
+BEGIN
+  IF OLD.status = 'pending' AND NEW.status = 'running'
+     AND NEW.started_at IS NOT DISTINCT FROM OLD.started_at THEN
+    NEW.started_at := NOW();
+  ELSIF OLD.status = 'running'
+     AND NEW.status IN ('completed', 'failed', 'cancelled', 'blocked')
+     AND NEW.completed_at IS NOT DISTINCT FROM OLD.completed_at THEN
+    NEW.completed_at := NOW();
+  END IF;
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS runs_stamp_status_times ON runs;
+CREATE TRIGGER runs_stamp_status_times
+  BEFORE UPDATE OF status ON runs
+  FOR EACH ROW
+  WHEN (NEW.status IS DISTINCT FROM OLD.status)
+  EXECUTE FUNCTION stamp_run_status_times();
+
+COMMIT;
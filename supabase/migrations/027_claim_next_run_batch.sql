@@ -0,0 +1,50 @@
+-- 027_claim_next_run_batch.sql
+-- Let claim_next_run claim several runs in one round-trip.
+--
+-- Problem: a worker with N free slots (MAX_CONCURRENT_RUNS) and a backlog
+--   of pending runs calls claim_next_run N times back to back before its
+--   pool is full — one PostgREST round-trip per run.
+--
+-- Fix: add p_limit (default 1). The worker passes its free slot count, so
+--   every claimed run starts immediately; nothing is held in a local queue,
+--   and a crashed worker strands no more runs than it was executing.
+--
+-- A new parameter changes the function's signature, so the 025 version is
+-- dropped first; leaving both would make calls that pass only
+-- p_excluded_modes ambiguous to PostgREST.
+
+BEGIN;
+
+DROP FUNCTION IF EXISTS claim_next_run(TEXT[]);
+
+CREATE OR REPLACE FUNCTION claim_next_run(
+  p_excluded_modes TEXT[] DEFAULT '{}',
+  p_limit INT DEFAULT 1
+) RETURNS SETOF runs
+LANGUAGE sql
+SECURITY INVOKER
+AS $$
+  UPDATE runs
+  SET status = 'running',
+      started_at = NOW()
+  WHERE id IN (
+    SELECT id
+    FROM runs
+    WHERE status = 'pending'
+      AND NOT (mode::text = ANY (p_excluded_modes))
+    ORDER BY created_at
+    LIMIT GREATEST(p_limit, 1)
+    FOR UPDATE SKIP LOCKED
+  )
+  RETURNING *;
+$$;
+
+COMMENT ON FUNCTION claim_next_run(TEXT[], INT) IS
+  'Atomically claim up to p_limit of the oldest pending runs not in '
+  'p_excluded_modes (SELECT ... FOR UPDATE SKIP LOCKED + UPDATE ... '
+  'RETURNING). Used by worker/worker.py::_claim_pending_runs.';
+
+GRANT EXECUTE ON FUNCTION claim_next_run(TEXT[], INT)
+  TO authenticated, service_role;
+
+COMMIT;
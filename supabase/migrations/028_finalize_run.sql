@@ -0,0 +1,59 @@
+-- 028_finalize_run.sql
+-- Finish a worker run in one round-trip and one transaction.
+--
+-- Problem (worker/worker.py::_execute_run): completing a run takes a bulk
+--   artifacts INSERT, a runs status UPDATE, and a clients.last_run_status
+--   UPDATE — three PostgREST calls, and a crash between them can leave a
+--   run marked completed without its artifacts (or vice versa).
+--
+-- Fix: finalize_run() does all three in one statement batch. Artifact rows
+--   arrive as a JSON array shaped like the artifacts table (the worker
+--   already uploads files to Storage and builds the rows); omitted columns
+--   such as created_at take their defaults. completed_at is stamped by the
+--   026 status trigger. The worker falls back to the separate writes if
+--   this function is not deployed.
+--
+-- Semantics match the old writes: error is only overwritten when given,
+-- and hitl_required is only ever raised, never cleared.
+
+BEGIN;
+
+CREATE OR REPLACE FUNCTION finalize_run(
+  p_run_id UUID,
+  p_status TEXT,
+  p_error TEXT DEFAULT NULL,
+  p_hitl_required BOOLEAN DEFAULT FALSE,
+  p_artifacts JSONB DEFAULT '[]'
+) RETURNS VOID
+LANGUAGE sql
+SECURITY INVOKER
+AS $$
+  INSERT INTO artifacts (
+    id, run_id, client_id, campaign_id, type, name, path,
+    storage_path, stage, size, metadata
+  )
+  SELECT
+    COALESCE(a.id, gen_random_uuid()), p_run_id, a.client_id, a.campaign_id,
+    a.type, a.name, a.path, a.storage_path, a.stage, a.size, a.metadata
+  FROM jsonb_populate_recordset(NULL::artifacts, p_artifacts) AS a;
+
+  UPDATE runs
+  SET status = p_status::run_status,
+      error = COALESCE(p_error, error),
+      hitl_required = hitl_required OR p_hitl_required
+  WHERE id = p_run_id;
+
+  UPDATE clients
+  SET last_run_status = p_status::run_status
+  WHERE id = (SELECT client_id FROM runs WHERE id = p_run_id);
+$$;
+
+COMMENT ON FUNCTION finalize_run(UUID, TEXT, TEXT, BOOLEAN, JSONB) IS
+  'Insert a run''s artifacts, set its final status, and mirror the status '
+  'onto clients.last_run_status in one transaction. Used by '
+  'worker/worker.py::_finalize_run.';
+
+GRANT EXECUTE ON FUNCTION finalize_run(UUID, TEXT, TEXT, BOOLEAN, JSONB)
+  TO authenticated, service_role;
+
+COMMIT;
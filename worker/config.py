@@ -24,6 +24,9 @@ BRAND_ASSETS_BASE = Path(os.getenv(
 
 # Brand profiles directory (inside brand-engine)
 BRAND_PROFILES_DIR = BRAND_ENGINE_ROOT / "data" / "brand_profiles"
+# Resolved once at import: the directory ships with the repo, so there's no
+# need to stat it on every grade/ingest. None → load_brand_profile's default.
+BRAND_PROFILES_DIR_STR = str(BRAND_PROFILES_DIR) if BRAND_PROFILES_DIR.exists() else None
 
 # Legacy tool paths (kept for CreativeExecutor / Temp-gen, and as subprocess fallback)
 TOOL_PATHS = {
@@ -39,12 +42,47 @@ TOOL_VENVS = {
     "bde": TOOL_PATHS["bde"] / "venv" / "bin" / "python",
 }
 
+# String forms of the above, computed once — executors splice these straight
+# into subprocess argv/cwd instead of re-stringifying a Path per command.
+TOOL_PATHS_STR = {name: str(path) for name, path in TOOL_PATHS.items()}
+TOOL_VENVS_STR = {name: str(path) for name, path in TOOL_VENVS.items()}
+
+# Keep a warm Temp-gen process (`main.py serve`) and send it jobs over stdin
+# instead of spawning `main.py` per run. Requires a Temp-gen build with serve
+# mode; runs fall back to a one-shot process if the daemon is busy or down.
+TEMP_GEN_DAEMON = os.getenv("TEMP_GEN_DAEMON", "0") == "1"
+# Warm Temp-gen processes kept per worker; concurrent creative runs beyond
+# this fall back to one-shot processes.
+TEMP_GEN_DAEMON_POOL_SIZE = int(os.getenv("TEMP_GEN_DAEMON_POOL_SIZE", "2"))
+
+# Generate images in-process via google-genai instead of through Temp-gen.
+# Skips the per-image interpreter + SDK start-up; video still goes through
+# Temp-gen. Needs GOOGLE_GENAI_API_KEY / GEMINI_API_KEY in the worker env.
+CREATIVE_DIRECT_GENAI = os.getenv("CREATIVE_DIRECT_GENAI", "0") == "1"
+CREATIVE_IMAGE_MODEL = os.getenv("CREATIVE_IMAGE_MODEL", "gemini-3-pro-image-preview")
+# Reuse a previously generated image when the same client asks for the
+# exact same prompt again (keyed on SHA-256 of client_id + prompt).
+CREATIVE_IMAGE_CACHE = os.getenv("CREATIVE_IMAGE_CACHE", "0") == "1"
+
 # Output paths
 OUTPUT_BASE = Path("/Users/timothysepulvado/Desktop/T7Sheild/ExternalDrives")
+OUTPUT_BASE_STR = str(OUTPUT_BASE)
 
 # Worker settings
 POLL_INTERVAL_SECONDS = 2
-MAX_CONCURRENT_RUNS = 1  # Start with 1 for simplicity
+# Direct (session-level) Postgres DSN for LISTEN/NOTIFY run wake-ups
+# (migration 024). When set, idle workers block on notifications and only
+# re-query for pending runs every POLL_FALLBACK_SECONDS as a safety net. The
+# same DSN carries run_logs batches over COPY (see log_copy.py).
+SUPABASE_DB_URL = os.getenv("SUPABASE_DB_URL")
+POLL_FALLBACK_SECONDS = 30
+# Runs are I/O-bound on the worker side (the heavy lifting happens in tool
+# subprocesses and remote APIs), so one slot per core is a safe default —
+# capped, because each slot also holds PostgREST/API requests open and a
+# large host shouldn't fan out past what Supabase and the model APIs absorb.
+# Size fleets so workers * MAX_CONCURRENT_RUNS stays within those limits.
+DEFAULT_MAX_CONCURRENT_RUNS = min(os.cpu_count() or 1, 5)
+MAX_CONCURRENT_RUNS = int(os.getenv("MAX_CONCURRENT_RUNS", DEFAULT_MAX_CONCURRENT_RUNS))
 
 # Prompt evolution thresholds
 PROMPT_AUTO_EVOLVE_THRESHOLD = 0.7   # Below this, auto-evolve
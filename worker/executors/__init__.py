@@ -1,7 +1,38 @@
-"""Executors for different run types."""
+"""Executors for different run types.
 
-from .ingest import IngestExecutor
-from .creative import CreativeExecutor
-from .grading import GradingExecutor
+Executor classes are resolved lazily (PEP 562) so a worker only pays the
+import cost — brand_engine, genai, pinecone — of the executors it actually
+dispatches to.
+"""
 
-__all__ = ["IngestExecutor", "CreativeExecutor", "GradingExecutor"]
+import importlib
+import os
+import sys
+
+# Executors import the worker's top-level ``config`` module. Make the worker
+# directory importable once here, for every submodule, rather than having
+# each one prepend it to sys.path again on import.
+_WORKER_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _WORKER_ROOT not in sys.path:
+    sys.path.insert(0, _WORKER_ROOT)
+
+_LAZY = {
+    "IngestExecutor": "ingest",
+    "CreativeExecutor": "creative",
+    "GradingExecutor": "grading",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{_LAZY[name]}", __name__)
+    obj = getattr(module, name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
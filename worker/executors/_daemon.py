@@ -0,0 +1,265 @@
+"""Persistent tool daemon — keeps a tool's interpreter warm between runs.
+
+Spawning ``python main.py ...`` per run re-pays interpreter startup plus the
+tool's SDK imports every time. A ``ToolDaemon`` instead launches the tool
+once in its serve mode and sends it jobs as newline-delimited JSON on stdin:
+
+    -> {"argv": ["nano", "generate", "--prompt", "...", "--output", "..."]}
+    <- {"event": "log", "message": "..."}            (zero or more)
+    <- {"event": "done", "ok": true}                 (or "ok": false, "error": "...")
+
+``argv`` is exactly what the one-shot CLI would have received, so the serve
+mode only has to dispatch it in-process. Any stdout line that isn't JSON is
+forwarded as a plain log line.
+
+A daemon runs one job at a time. ``try_call`` returns None when the daemon
+is busy so concurrent runs can fall back to a one-shot process instead of
+queueing behind, say, a 10-minute video job. A ``DaemonPool`` keeps several
+daemons per tool so that many concurrent runs each get a warm process;
+members start lazily, on the first job that finds all others busy.
+"""
+
+import atexit
+import json
+import os
+import selectors
+import subprocess
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from ._proc import READ_CHUNK_BYTES
+
+# orjson parses bytes directly (no decode pass) and is several times faster
+# than the stdlib for the per-line protocol traffic; it's optional.
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _loads = json.loads
+
+
+class ToolDaemonError(RuntimeError):
+    """The daemon could not be started or died mid-job."""
+
+
+class ToolDaemon:
+    """One long-lived tool process speaking the NDJSON job protocol."""
+
+    def __init__(self, cmd: List[str], cwd: str):
+        """
+        Initialize (but don't start) the daemon.
+
+        Args:
+            cmd: Command that starts the tool in serve mode
+            cwd: Working directory for the tool
+        """
+        self.cmd = cmd
+        self.cwd = cwd
+        self._proc: Optional[subprocess.Popen] = None
+        self._buf = b""
+        self._lock = threading.Lock()
+
+    def try_call(
+        self, argv: List[str], timeout: float, on_line: Callable[[str], None]
+    ) -> Optional[subprocess.CompletedProcess]:
+        """
+        Run one job on the daemon if it is idle.
+
+        Returns:
+            CompletedProcess (returncode 0 on success, 1 on tool error, with
+            the error text in stderr), or None if the daemon is busy
+
+        Raises:
+            ToolDaemonError: if the daemon can't start or exits mid-job
+            subprocess.TimeoutExpired: if the job outlives ``timeout``; the
+                daemon is killed and will respawn on the next call, as it
+                is for any other exception raised mid-job
+        """
+        if not self._lock.acquire(blocking=False):
+            return None
+        try:
+            return self._call(argv, timeout, on_line)
+        except BaseException:
+            # Whatever interrupted the job (e.g. a raising on_line), the
+            # daemon may still owe us its log lines and "done" event; the
+            # next job must not read those, so never reuse it.
+            self.close(graceful=False)
+            raise
+        finally:
+            self._lock.release()
+
+    def start(self) -> None:
+        """Start the daemon ahead of its first job, if idle and not running.
+
+        Raises:
+            ToolDaemonError: if the daemon can't start
+        """
+        if not self._lock.acquire(blocking=False):
+            return  # busy means it's already running a job
+        try:
+            self._ensure_started()
+        finally:
+            self._lock.release()
+
+    def is_running(self) -> bool:
+        """Whether the daemon process is currently alive."""
+        return self._proc is not None and self._proc.poll() is None
+
+    def close(self, graceful: bool = True) -> None:
+        """Stop the daemon process, if running.
+
+        Graceful close lets the daemon exit on stdin EOF; otherwise (hung or
+        misbehaving daemon) it is killed outright.
+        """
+        proc, self._proc = self._proc, None
+        self._buf = b""
+        if proc is None or proc.poll() is not None:
+            return
+        if not graceful:
+            proc.kill()
+            proc.wait()
+            return
+        try:
+            proc.stdin.close()
+            proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+            proc.wait()
+
+    def _ensure_started(self) -> subprocess.Popen:
+        if self._proc is None or self._proc.poll() is not None:
+            try:
+                self._proc = subprocess.Popen(
+                    self.cmd,
+                    cwd=self.cwd,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                )
+            except OSError as e:
+                self._proc = None
+                raise ToolDaemonError(f"failed to start: {e}") from e
+            self._buf = b""
+        return self._proc
+
+    def _call(
+        self, argv: List[str], timeout: float, on_line: Callable[[str], None]
+    ) -> subprocess.CompletedProcess:
+        deadline = time.monotonic() + timeout
+        proc = self._ensure_started()
+
+        try:
+            proc.stdin.write(_dumps({"argv": argv}) + b"\n")
+            proc.stdin.flush()
+        except OSError as e:
+            self.close(graceful=False)
+            raise ToolDaemonError(f"exited before accepting job: {e}") from e
+
+        fd = proc.stdout.fileno()
+        with selectors.DefaultSelector() as sel:
+            sel.register(fd, selectors.EVENT_READ)
+            while True:
+                while b"\n" in self._buf:
+                    raw, self._buf = self._buf.split(b"\n", 1)
+                    done = self._handle_line(raw, argv, on_line)
+                    if done is not None:
+                        return done
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.close(graceful=False)
+                    raise subprocess.TimeoutExpired(self.cmd, timeout)
+                if not sel.select(remaining):
+                    continue
+
+                chunk = os.read(fd, READ_CHUNK_BYTES)
+                if not chunk:
+                    self.close(graceful=False)
+                    raise ToolDaemonError("exited mid-job")
+                self._buf += chunk
+
+    @staticmethod
+    def _handle_line(
+        raw: bytes, argv: List[str], on_line: Callable[[str], None]
+    ) -> Optional[subprocess.CompletedProcess]:
+        raw = raw.strip()
+        if not raw:
+            return None
+        try:
+            msg = _loads(raw)
+        except ValueError:  # orjson.JSONDecodeError subclasses ValueError
+            msg = None
+        if not isinstance(msg, dict):
+            on_line(raw.decode("utf-8", errors="replace"))
+            return None
+
+        if msg.get("event") == "done":
+            ok = bool(msg.get("ok"))
+            return subprocess.CompletedProcess(
+                argv, 0 if ok else 1, stdout=None, stderr=msg.get("error", "")
+            )
+        if msg.get("message"):
+            on_line(str(msg["message"]).strip())
+        return None
+
+
+class DaemonPool:
+    """Fixed-size set of ToolDaemons for one tool."""
+
+    def __init__(self, cmd: List[str], cwd: str, size: int):
+        self.daemons = [ToolDaemon(cmd, cwd) for _ in range(max(1, size))]
+
+    def try_call(
+        self, argv: List[str], timeout: float, on_line: Callable[[str], None]
+    ) -> Optional[subprocess.CompletedProcess]:
+        """Run the job on the first idle daemon; None if all are busy.
+
+        Running daemons are preferred over cold members so the pool only
+        grows when concurrency actually demands it.
+        """
+        ordered = sorted(self.daemons, key=lambda d: not d.is_running())
+        for daemon in ordered:
+            result = daemon.try_call(argv, timeout, on_line)
+            if result is not None:
+                return result
+        return None
+
+    def prewarm(self) -> None:
+        """Start every member now so the first runs skip the cold start.
+
+        Raises:
+            ToolDaemonError: if a member can't start
+        """
+        for daemon in self.daemons:
+            daemon.start()
+
+    def close(self) -> None:
+        for daemon in self.daemons:
+            daemon.close()
+
+
+_POOLS: Dict[str, DaemonPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def get_daemon_pool(name: str, cmd: List[str], cwd: str, size: int) -> DaemonPool:
+    """Return the process-wide daemon pool for ``name``, creating it on first use."""
+    with _POOLS_LOCK:
+        pool = _POOLS.get(name)
+        if pool is None:
+            pool = _POOLS[name] = DaemonPool(cmd, cwd, size)
+        return pool
+
+
+@atexit.register
+def _close_all() -> None:
+    for pool in list(_POOLS.values()):
+        pool.close()
@@ -0,0 +1,53 @@
+"""Filesystem helpers shared by the executors."""
+
+import hashlib
+import os
+import shutil
+import threading
+from typing import Set
+
+from config import OUTPUT_BASE_STR
+
+# Directories this process has already created. Output dirs are per-client
+# and stable, so after the first run for a client the mkdir (and its stat
+# walk up the ancestor chain) is skipped entirely.
+_MKDIR_CACHE: Set[str] = set()
+
+
+def output_file_path(client_id: str, kind: str, file_name: str) -> str:
+    """Build ``{OUTPUT_BASE}/{client_id}/{kind}/{file_name}`` as a plain string.
+
+    One ``os.path.join`` instead of a chain of ``Path.__truediv__`` calls,
+    each of which allocates and re-parses a new Path.
+    """
+    return os.path.join(OUTPUT_BASE_STR, client_id, kind, file_name)
+
+
+def ensure_parent_dir(path) -> None:
+    """Create ``path``'s parent directory once per process."""
+    parent = os.path.dirname(os.fspath(path))
+    if parent in _MKDIR_CACHE:
+        return
+    os.makedirs(parent, exist_ok=True)
+    _MKDIR_CACHE.add(parent)
+
+
+def image_cache_path(client_id: str, prompt: str) -> str:
+    """Cache slot for an image generated from exactly ``prompt`` for ``client_id``."""
+    key = hashlib.sha256(f"{client_id}|{prompt}".encode("utf-8")).hexdigest()
+    return os.path.join(OUTPUT_BASE_STR, "_cache", "images", f"{key}.png")
+
+
+def link_or_copy(src: str, dst: str) -> None:
+    """Place ``src``'s contents at ``dst``, hard-linking when possible.
+
+    Written via a temp name + ``os.replace`` so a reader never sees a
+    half-copied file. Falls back to a copy across filesystems.
+    """
+    ensure_parent_dir(dst)
+    tmp = f"{dst}.tmp{os.getpid()}-{threading.get_ident()}"
+    try:
+        os.link(src, tmp)
+    except OSError:
+        shutil.copyfile(src, tmp)
+    os.replace(tmp, dst)
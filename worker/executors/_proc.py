@@ -0,0 +1,137 @@
+"""Subprocess helper — runs a tool command and streams its output live.
+
+Replaces the ``subprocess.run(..., capture_output=True)`` pattern, which
+buffered the child's entire stdout until exit and only then replayed it to
+the log callback. Here both pipes are drained through a single selector
+(epoll on Linux, kqueue on macOS) so stdout lines reach ``on_line`` as soon
+as the child emits them, and stderr is collected for the failure path.
+
+On Linux the child's exit is watched through a pidfd registered on the same
+selector, so the thread sleeps in the kernel until output, exit, or the
+deadline — no ``waitpid(WNOHANG)`` + sleep loop as in ``Popen.wait(timeout)``.
+Elsewhere we fall back to ``Popen.wait`` once both pipes hit EOF.
+"""
+
+import os
+import selectors
+import subprocess
+import time
+from typing import Callable, List, Optional
+
+READ_CHUNK_BYTES = 64 * 1024
+
+# Only the tail of stderr is kept for the failure message: tracebacks end
+# there, and a chatty tool can't grow the worker's memory without bound.
+STDERR_TAIL_BYTES = 16 * 1024
+
+
+def _open_pidfd(pid: int) -> Optional[int]:
+    """Return a pidfd for ``pid``, or None where unsupported (macOS, old kernels)."""
+    pidfd_open = getattr(os, "pidfd_open", None)
+    if pidfd_open is None:
+        return None
+    try:
+        return pidfd_open(pid)
+    except OSError:
+        return None
+
+
+def run_streaming(
+    cmd: List[str],
+    cwd: str,
+    timeout: float,
+    on_line: Callable[[str], None],
+) -> subprocess.CompletedProcess:
+    """
+    Run ``cmd`` and forward each non-empty stdout line to ``on_line``.
+
+    Args:
+        cmd: Command and arguments
+        cwd: Working directory for the child
+        timeout: Wall-clock limit in seconds
+        on_line: Called with each stripped stdout line as it arrives
+
+    Returns:
+        CompletedProcess with returncode and the decoded tail of stderr
+        (stdout is None, since it has already been streamed)
+
+    Raises:
+        subprocess.TimeoutExpired: if the child outlives ``timeout``; the
+            child is killed before raising, as it is for any other error
+    """
+    deadline = time.monotonic() + timeout
+    proc = subprocess.Popen(
+        cmd,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        bufsize=0,
+    )
+
+    sel = selectors.DefaultSelector()
+    sel.register(proc.stdout, selectors.EVENT_READ, "stdout")
+    sel.register(proc.stderr, selectors.EVENT_READ, "stderr")
+
+    pidfd = _open_pidfd(proc.pid)
+    if pidfd is not None:
+        sel.register(pidfd, selectors.EVENT_READ, "exit")
+
+    pending = b""
+    stderr_tail = bytearray()
+
+    def emit(raw: bytes) -> None:
+        line = raw.decode("utf-8", errors="replace").strip()
+        if line:
+            on_line(line)
+
+    try:
+        while sel.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired(cmd, timeout)
+
+            for key, _ in sel.select(remaining):
+                if key.data == "exit":
+                    # Child has exited; keep draining pipes until EOF.
+                    sel.unregister(pidfd)
+                    continue
+
+                chunk = os.read(key.fd, READ_CHUNK_BYTES)
+                if not chunk:
+                    sel.unregister(key.fileobj)
+                    key.fileobj.close()
+                    continue
+
+                if key.data == "stderr":
+                    stderr_tail += chunk
+                    del stderr_tail[:-STDERR_TAIL_BYTES]
+                    continue
+
+                pending += chunk
+                *lines, pending = pending.split(b"\n")
+                for line in lines:
+                    emit(line)
+
+        if pending:
+            emit(pending)
+
+        if pidfd is not None:
+            returncode = proc.wait()  # pidfd fired: reap without polling
+        else:
+            returncode = proc.wait(timeout=max(deadline - time.monotonic(), 0))
+
+    finally:
+        # Timeout, a raising on_line, or any other error: never leave the
+        # child running (or unreaped) behind us.
+        if proc.returncode is None:
+            proc.kill()
+            proc.wait()
+        sel.close()
+        if pidfd is not None:
+            os.close(pidfd)
+        for pipe in (proc.stdout, proc.stderr):
+            if not pipe.closed:
+                pipe.close()
+
+    stderr = stderr_tail.decode("utf-8", errors="replace")
+    return subprocess.CompletedProcess(cmd, returncode, stdout=None, stderr=stderr)
@@ -1,14 +1,47 @@
 """Creative executor - runs Temp-gen for image/video generation."""
 
+import os
 import subprocess
-import sys
 import time
-from pathlib import Path
-from typing import Callable, Optional
-
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-from config import TOOL_PATHS, TOOL_VENVS, OUTPUT_BASE
+from typing import Callable, List, Optional
+
+from config import (
+    CREATIVE_DIRECT_GENAI,
+    CREATIVE_IMAGE_CACHE,
+    CREATIVE_IMAGE_MODEL,
+    TOOL_PATHS_STR,
+    TOOL_VENVS_STR,
+    TEMP_GEN_DAEMON,
+    TEMP_GEN_DAEMON_POOL_SIZE,
+)
+
+from ._daemon import DaemonPool, ToolDaemonError, get_daemon_pool
+from ._paths import ensure_parent_dir, image_cache_path, link_or_copy, output_file_path
+from ._proc import run_streaming
+
+# google-genai is optional in the worker env; without it images go through
+# Temp-gen as before.
+try:
+    from google import genai
+    from google.genai import types as genai_types
+
+    GENAI_AVAILABLE = True
+except ImportError:
+    GENAI_AVAILABLE = False
+
+IMAGE_TIMEOUT_SECONDS = 180
+# Model behind Temp-gen's `nano generate` (recorded in artifact metadata).
+TEMP_GEN_IMAGE_MODEL = "gemini-3-pro-image"
+
+
+def _temp_gen_daemons() -> DaemonPool:
+    """The worker-wide pool of warm Temp-gen (`main.py serve`) processes."""
+    return get_daemon_pool(
+        "temp_gen",
+        [TOOL_VENVS_STR["temp_gen"], "main.py", "serve"],
+        TOOL_PATHS_STR["temp_gen"],
+        TEMP_GEN_DAEMON_POOL_SIZE,
+    )
 
 
 class CreativeExecutor:
@@ -22,8 +55,78 @@ class CreativeExecutor:
             log_callback: Function to call with (stage, level, message) for logging
         """
         self.log = log_callback
-        self.tool_path = TOOL_PATHS["temp_gen"]
-        self.python = TOOL_VENVS["temp_gen"]
+        self.tool_path_str = TOOL_PATHS_STR["temp_gen"]
+        self.python_str = TOOL_VENVS_STR["temp_gen"]
+        self._genai = self._init_genai() if CREATIVE_DIRECT_GENAI else None
+
+    @staticmethod
+    def prewarm() -> None:
+        """Start the Temp-gen daemons now, before the first creative run.
+
+        Failures are not fatal — runs retry the start or fall back to
+        one-shot processes.
+        """
+        try:
+            _temp_gen_daemons().prewarm()
+        except ToolDaemonError as e:
+            print(f"[Worker] Temp-gen daemon prewarm failed: {e}")
+
+    def _init_genai(self) -> Optional["genai.Client"]:
+        """Build the in-process Gemini client, or None to use Temp-gen."""
+        if not GENAI_AVAILABLE:
+            self.log("creative", "warn", "google-genai not installed — using Temp-gen")
+            return None
+        api_key = os.getenv("GOOGLE_GENAI_API_KEY") or os.getenv("GEMINI_API_KEY")
+        if not api_key:
+            self.log("creative", "warn", "No Gemini API key set — using Temp-gen")
+            return None
+        return genai.Client(
+            api_key=api_key,
+            http_options=genai_types.HttpOptions(timeout=IMAGE_TIMEOUT_SECONDS * 1000),
+        )
+
+    def _generate_image_direct(self, prompt: str, output_path: str) -> None:
+        """Generate one image in-process and write it to ``output_path``.
+
+        Raises:
+            RuntimeError: if the response carries no image data
+        """
+        response = self._genai.models.generate_content(
+            model=CREATIVE_IMAGE_MODEL,
+            contents=prompt,
+        )
+        for candidate in response.candidates or []:
+            for part in candidate.content.parts or []:
+                if part.inline_data and part.inline_data.data:
+                    with open(output_path, "wb") as f:
+                        f.write(part.inline_data.data)
+                    return
+        raise RuntimeError("Gemini returned no image data")
+
+    def _run_tool(self, argv: List[str], timeout: float) -> subprocess.CompletedProcess:
+        """
+        Run a Temp-gen CLI command, streaming its output to the log.
+
+        Uses a warm Temp-gen daemon when TEMP_GEN_DAEMON is enabled and one is
+        idle; otherwise spawns a one-shot `main.py` process.
+        """
+        on_line = lambda line: self.log("creative", "info", line)
+
+        if TEMP_GEN_DAEMON:
+            try:
+                result = _temp_gen_daemons().try_call(argv, timeout, on_line)
+                if result is not None:
+                    return result
+                self.log("creative", "info", "All Temp-gen daemons busy — spawning one-shot process")
+            except ToolDaemonError as e:
+                self.log("creative", "warn", f"Temp-gen daemon unavailable ({e}) — spawning one-shot process")
+
+        return run_streaming(
+            [self.python_str, "main.py", *argv],
+            cwd=self.tool_path_str,
+            timeout=timeout,
+            on_line=on_line,
+        )
 
     def generate_image(
         self, run_id: str, client_id: str, prompt: str, output_name: Optional[str] = None
@@ -44,68 +147,91 @@ class CreativeExecutor:
 
         # Generate output path
         timestamp = int(time.time())
-        output_name = output_name or f"gen_image_{client_id}_{timestamp}.png"
-        output_path = OUTPUT_BASE / client_id / "images" / output_name
+        output_name = output_name or f"gen_image_{client_id}_{run_id}_{timestamp}.png"
+        output_path = output_file_path(client_id, "images", output_name)
 
         # Ensure output directory exists
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        ensure_parent_dir(output_path)
 
         self.log("creative", "info", f"Output path: {output_path}")
 
+        model = CREATIVE_IMAGE_MODEL if self._genai is not None else TEMP_GEN_IMAGE_MODEL
+        cache_path = image_cache_path(client_id, prompt) if CREATIVE_IMAGE_CACHE else None
+        if cache_path and os.path.exists(cache_path):
+            try:
+                link_or_copy(cache_path, output_path)
+                self.log("creative", "info", f"Reused cached image for identical prompt: {output_path}")
+                return self._image_result(output_name, output_path, prompt, model, cached=True)
+            except OSError as e:
+                self.log("creative", "warn", f"Image cache read failed ({e}) — regenerating")
+
         try:
+            if self._genai is not None:
+                self.log("creative", "info", f"Running Gemini image generation ({CREATIVE_IMAGE_MODEL})...")
+                self._generate_image_direct(prompt, output_path)
+                self.log("creative", "info", f"Image saved to: {output_path}")
+                self._store_cached_image(cache_path, output_path)
+                return self._image_result(output_name, output_path, prompt, model)
+
             # Run the nano_banana generate command
-            cmd = [
-                str(self.python),
-                "main.py",
+            argv = [
                 "nano",
                 "generate",
                 "--prompt",
                 prompt,
                 "--output",
-                str(output_path),
+                output_path,
             ]
 
             self.log("creative", "info", "Running Gemini image generation...")
 
-            result = subprocess.run(
-                cmd,
-                cwd=str(self.tool_path),
-                capture_output=True,
-                text=True,
-                timeout=180,  # 3 minutes for image gen
-            )
-
-            # Stream stdout lines as logs
-            for line in result.stdout.strip().split("\n"):
-                if line.strip():
-                    self.log("creative", "info", line.strip())
+            result = self._run_tool(argv, timeout=IMAGE_TIMEOUT_SECONDS)
 
             if result.returncode != 0:
                 self.log("creative", "error", f"Image generation failed: {result.stderr}")
                 return {"status": "failed", "error": result.stderr}
 
             self.log("creative", "info", f"Image saved to: {output_path}")
+            self._store_cached_image(cache_path, output_path)
 
-            return {
-                "status": "completed",
-                "artifacts": [
-                    {
-                        "type": "image",
-                        "name": output_name,
-                        "path": str(output_path),
-                        "stage": "generate_images",
-                        "metadata": {"model": "gemini-3-pro-image", "prompt": prompt},
-                    }
-                ],
-            }
+            return self._image_result(output_name, output_path, prompt, model)
 
         except subprocess.TimeoutExpired:
-            self.log("creative", "error", "Image generation timed out after 180s")
+            self.log("creative", "error", f"Image generation timed out after {IMAGE_TIMEOUT_SECONDS}s")
             return {"status": "failed", "error": "Timeout"}
         except Exception as e:
             self.log("creative", "error", f"Image generation error: {str(e)}")
             return {"status": "failed", "error": str(e)}
 
+    def _store_cached_image(self, cache_path: Optional[str], output_path: str) -> None:
+        """Best-effort: a cache write failure must not fail the run."""
+        if not cache_path or not os.path.exists(output_path):
+            return
+        try:
+            link_or_copy(output_path, cache_path)
+        except OSError as e:
+            self.log("creative", "warn", f"Could not cache generated image: {e}")
+
+    @staticmethod
+    def _image_result(
+        output_name: str, output_path: str, prompt: str, model: str, cached: bool = False
+    ) -> dict:
+        metadata = {"model": model, "prompt": prompt}
+        if cached:
+            metadata["cached"] = True
+        return {
+            "status": "completed",
+            "artifacts": [
+                {
+                    "type": "image",
+                    "name": output_name,
+                    "path": output_path,
+                    "stage": "generate_images",
+                    "metadata": metadata,
+                }
+            ],
+        }
+
     def generate_video(
         self, run_id: str, client_id: str, prompt: str, output_name: Optional[str] = None
     ) -> dict:
@@ -125,41 +251,28 @@ class CreativeExecutor:
 
         # Generate output path
         timestamp = int(time.time())
-        output_name = output_name or f"gen_video_{client_id}_{timestamp}.mp4"
-        output_path = OUTPUT_BASE / client_id / "videos" / output_name
+        output_name = output_name or f"gen_video_{client_id}_{run_id}_{timestamp}.mp4"
+        output_path = output_file_path(client_id, "videos", output_name)
 
         # Ensure output directory exists
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        ensure_parent_dir(output_path)
 
         self.log("creative", "info", f"Output path: {output_path}")
 
         try:
             # Run the veo generate command
-            cmd = [
-                str(self.python),
-                "main.py",
+            argv = [
                 "veo",
                 "generate",
                 "--prompt",
                 prompt,
                 "--output",
-                str(output_path),
+                output_path,
             ]
 
             self.log("creative", "info", "Running Veo 3.1 video generation...")
 
-            result = subprocess.run(
-                cmd,
-                cwd=str(self.tool_path),
-                capture_output=True,
-                text=True,
-                timeout=600,  # 10 minutes for video gen
-            )
-
-            # Stream stdout lines as logs
-            for line in result.stdout.strip().split("\n"):
-                if line.strip():
-                    self.log("creative", "info", line.strip())
+            result = self._run_tool(argv, timeout=600)  # 10 minutes for video gen
 
             if result.returncode != 0:
                 self.log("creative", "error", f"Video generation failed: {result.stderr}")
@@ -173,7 +286,7 @@ class CreativeExecutor:
                     {
                         "type": "video",
                         "name": output_name,
-                        "path": str(output_path),
+                        "path": output_path,
                         "stage": "generate_video",
                         "metadata": {"model": "veo-3.1", "prompt": prompt},
                     }
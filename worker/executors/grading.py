@@ -6,14 +6,17 @@ BrandGrader for dual-fusion (Gemini + Cohere) grading with optional
 pixel analysis.
 """
 
+import hashlib
 import json
-import sys
-from pathlib import Path
-from typing import Callable, Optional
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-from config import BRAND_ASSETS_BASE, BRAND_PROFILES_DIR, OUTPUT_BASE
+from config import BRAND_ASSETS_BASE, BRAND_PROFILES_DIR_STR
+
+from ._paths import ensure_parent_dir, output_file_path
 
 # Try importing brand-engine (config.py adds it to sys.path)
 try:
@@ -24,6 +27,71 @@ try:
 except ImportError:
     BRAND_ENGINE_AVAILABLE = False
 
+SAMPLE_IMAGE_EXTS = (".jpg", ".jpeg", ".png", ".webp")
+
+# Grade results keyed on (brand, profile contents, image content, query,
+# tier, pixel flag). A regen that reproduces an identical image, or a
+# re-grade of the same file, then skips the embedding + Pinecone
+# round-trips. Editing the profile (thresholds are hot-reloaded) changes
+# the key; entries for a brand are dropped when this process re-ingests
+# it, and expire after GRADE_CACHE_TTL_SECONDS to cover ingests done
+# elsewhere.
+GRADE_CACHE_SIZE = 256
+GRADE_CACHE_TTL_SECONDS = 600.0
+_GRADE_CACHE: "OrderedDict[tuple, tuple[float, object]]" = OrderedDict()
+_GRADE_CACHE_LOCK = threading.Lock()
+
+
+def _image_digest(image_path: str) -> str:
+    """BLAKE2b of the image bytes — identifies the content, not the path."""
+    digest = hashlib.blake2b()
+    with open(image_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _profile_digest(profile) -> str:
+    """BLAKE2b of the loaded profile, so an edited profile misses the cache."""
+    return hashlib.blake2b(profile.model_dump_json().encode()).hexdigest()
+
+
+def invalidate_grade_cache(brand_slug: str) -> None:
+    """Forget cached grades for ``brand_slug`` (call after re-indexing it)."""
+    with _GRADE_CACHE_LOCK:
+        for key in [k for k in _GRADE_CACHE if k[0] == brand_slug]:
+            del _GRADE_CACHE[key]
+
+
+# Found sample images per brand. Misses aren't cached, so a brand folder
+# that is mounted or populated after the first lookup is still picked up.
+_SAMPLE_IMAGES: Dict[str, str] = {}
+
+
+def _find_sample_image(brand_slug: str) -> Optional[str]:
+    """Find a sample image for demo/fallback grading.
+
+    Brand reference folders are static for the life of the worker, so a
+    found image is cached per brand and its folder isn't scanned again.
+    """
+    cached = _SAMPLE_IMAGES.get(brand_slug)
+    if cached is not None:
+        return cached
+    candidates = (
+        BRAND_ASSETS_BASE / brand_slug / "reference_images",
+        BRAND_ASSETS_BASE / brand_slug,
+    )
+    for candidate in candidates:
+        try:
+            with os.scandir(candidate) as entries:
+                for entry in entries:
+                    if entry.name.lower().endswith(SAMPLE_IMAGE_EXTS):
+                        _SAMPLE_IMAGES[brand_slug] = entry.path
+                        return entry.path
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+    return None
+
 
 class GradingExecutor:
     """Executor for grading (brand drift/compliance) operations.
@@ -51,21 +119,7 @@ class GradingExecutor:
 
     def _find_sample_image(self, brand_slug: str) -> Optional[str]:
         """Find a sample image for demo/fallback grading."""
-        candidates = [
-            BRAND_ASSETS_BASE / brand_slug / "reference_images",
-            BRAND_ASSETS_BASE / brand_slug,
-        ]
-        image_exts = {".jpg", ".jpeg", ".png", ".webp"}
-
-        for candidate in candidates:
-            if candidate.exists():
-                images = [
-                    f for f in candidate.iterdir()
-                    if f.suffix.lower() in image_exts
-                ]
-                if images:
-                    return str(images[0])
-        return None
+        return _find_sample_image(brand_slug)
 
     def execute(
         self, run_id: str, client_id: str, params: Optional[dict] = None
@@ -89,7 +143,7 @@ class GradingExecutor:
             dict with status, grade decision, metrics, and report artifact
         """
         params = params or {}
-        brand_slug = client_id.replace("client_", "")
+        brand_slug = client_id.removeprefix("client_")
         index_tier = params.get("index_tier", "brand-dna")
 
         # Get image path — required for grading
@@ -119,8 +173,7 @@ class GradingExecutor:
 
         # Load brand profile
         try:
-            profiles_dir = str(BRAND_PROFILES_DIR) if BRAND_PROFILES_DIR.exists() else None
-            profile = load_brand_profile(brand_slug, profiles_dir=profiles_dir)
+            profile = load_brand_profile(brand_slug, profiles_dir=BRAND_PROFILES_DIR_STR)
             self.log("grading", "info", f"Loaded brand profile: {profile.display_name}")
         except FileNotFoundError:
             self.log("grading", "error", f"No brand profile found for '{brand_slug}'")
@@ -128,14 +181,37 @@ class GradingExecutor:
 
         # Run grading via brand-engine
         try:
-            grader = self._get_grader()
-            result = grader.grade(
-                image_path=image_path,
-                profile=profile,
-                text_query=text_query,
-                include_pixel_analysis=params.get("include_pixel_analysis", True),
-                index_tier=index_tier,
+            include_pixel = params.get("include_pixel_analysis", True)
+            cache_key = (
+                brand_slug, _profile_digest(profile), _image_digest(image_path),
+                text_query, index_tier, include_pixel,
             )
+            result = None
+            with _GRADE_CACHE_LOCK:
+                entry = _GRADE_CACHE.get(cache_key)
+                if entry is not None:
+                    stored_at, cached = entry
+                    if time.monotonic() - stored_at < GRADE_CACHE_TTL_SECONDS:
+                        result = cached
+                        _GRADE_CACHE.move_to_end(cache_key)
+                    else:
+                        del _GRADE_CACHE[cache_key]
+
+            if result is not None:
+                self.log("grading", "info", "Identical image already graded — reusing result")
+            else:
+                grader = self._get_grader()
+                result = grader.grade(
+                    image_path=image_path,
+                    profile=profile,
+                    text_query=text_query,
+                    include_pixel_analysis=include_pixel,
+                    index_tier=index_tier,
+                )
+                with _GRADE_CACHE_LOCK:
+                    _GRADE_CACHE[cache_key] = (time.monotonic(), result)
+                    if len(_GRADE_CACHE) > GRADE_CACHE_SIZE:
+                        _GRADE_CACHE.popitem(last=False)
 
             self.log("grading", "info", f"Gate Decision: {result.gate_decision}")
             self.log(
@@ -165,12 +241,13 @@ class GradingExecutor:
                 self.log("grading", "warn", "Image requires human review")
 
             # Save report as artifact
-            report_path = OUTPUT_BASE / client_id / "reports" / f"grade_{run_id}.json"
-            report_path.parent.mkdir(parents=True, exist_ok=True)
+            report_path = output_file_path(client_id, "reports", f"grade_{run_id}.json")
+            ensure_parent_dir(report_path)
 
-            report_data = result.model_dump()
+            # Serialize straight from the model (pydantic-core) — no
+            # intermediate dict + stdlib json pass over the same data.
             with open(report_path, "w") as f:
-                json.dump(report_data, f, indent=2)
+                f.write(result.model_dump_json(indent=2))
 
             self.log("grading", "info", f"Report saved to: {report_path}")
 
@@ -190,7 +267,7 @@ class GradingExecutor:
                     {
                         "type": "report",
                         "name": f"grade_{run_id}.json",
-                        "path": str(report_path),
+                        "path": report_path,
                     }
                 ],
             }
@@ -202,8 +279,6 @@ class GradingExecutor:
 
     def _demo_grade(self, run_id: str, client_id: str, brand_slug: str) -> dict:
         """Simulate grading for demo/fallback purposes."""
-        import time
-
         self.log("grading", "info", f"[DEMO] Loading brand embeddings for {brand_slug}...")
         time.sleep(0.8)
         self.log("grading", "info", "[DEMO] Running Gemini Embed 2 similarity...")
@@ -218,8 +293,8 @@ class GradingExecutor:
         self.log("grading", "info", "[DEMO] Combined Z-Score: 0.72 (simulated)")
 
         # Save demo report
-        report_path = OUTPUT_BASE / client_id / "reports" / f"grade_{run_id}.json"
-        report_path.parent.mkdir(parents=True, exist_ok=True)
+        report_path = output_file_path(client_id, "reports", f"grade_{run_id}.json")
+        ensure_parent_dir(report_path)
         demo_report = {
             "demo": True,
             "gate_decision": "HITL_REVIEW",
@@ -242,7 +317,7 @@ class GradingExecutor:
                 {
                     "type": "report",
                     "name": f"grade_{run_id}.json",
-                    "path": str(report_path),
+                    "path": report_path,
                 }
             ],
         }
@@ -5,14 +5,14 @@ Python imports from the consolidated brand-engine SDK. Falls back
 to demo mode when brand-engine dependencies are unavailable.
 """
 
-import json
-import sys
+import time
 from pathlib import Path
 from typing import Callable, Optional
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-from config import BRAND_ASSETS_BASE, BRAND_PROFILES_DIR, OUTPUT_BASE
+from config import BRAND_ASSETS_BASE, BRAND_PROFILES_DIR_STR
+
+from ._paths import ensure_parent_dir, output_file_path
+from .grading import invalidate_grade_cache
 
 # Try importing brand-engine (config.py adds it to sys.path)
 try:
@@ -92,7 +92,7 @@ class IngestExecutor:
             dict with status and any artifacts
         """
         params = params or {}
-        brand_slug = client_id.replace("client_", "")
+        brand_slug = client_id.removeprefix("client_")
         index_tier = params.get("index_tier", "brand-dna")
 
         self.log("ingest", "info", f"Starting ingest for brand '{brand_slug}'")
@@ -104,8 +104,7 @@ class IngestExecutor:
 
         # Load brand profile
         try:
-            profiles_dir = str(BRAND_PROFILES_DIR) if BRAND_PROFILES_DIR.exists() else None
-            profile = load_brand_profile(brand_slug, profiles_dir=profiles_dir)
+            profile = load_brand_profile(brand_slug, profiles_dir=BRAND_PROFILES_DIR_STR)
             self.log("ingest", "info", f"Loaded brand profile: {profile.display_name}")
         except FileNotFoundError:
             self.log("ingest", "error", f"No brand profile found for '{brand_slug}'")
@@ -140,11 +139,14 @@ class IngestExecutor:
                 for err in result.errors:
                     self.log("ingest", "warn", f"Ingest warning: {err}")
 
+            # The brand's index just changed — cached grades are stale.
+            invalidate_grade_cache(brand_slug)
+
             # Save ingest report
-            report_path = OUTPUT_BASE / client_id / "reports" / f"ingest_{run_id}.json"
-            report_path.parent.mkdir(parents=True, exist_ok=True)
+            report_path = output_file_path(client_id, "reports", f"ingest_{run_id}.json")
+            ensure_parent_dir(report_path)
             with open(report_path, "w") as f:
-                json.dump(result.model_dump(), f, indent=2)
+                f.write(result.model_dump_json(indent=2))
 
             return {
                 "status": "completed",
@@ -153,7 +155,7 @@ class IngestExecutor:
                     {
                         "type": "report",
                         "name": f"ingest_{run_id}.json",
-                        "path": str(report_path),
+                        "path": report_path,
                     }
                 ],
             }
@@ -165,8 +167,6 @@ class IngestExecutor:
 
     def _demo_ingest(self, brand_slug: str) -> dict:
         """Simulate ingest for demo/fallback purposes."""
-        import time
-
         self.log("ingest", "info", f"[DEMO] Scanning brand assets for {brand_slug}...")
         time.sleep(1.0)
         self.log("ingest", "info", "[DEMO] Generating Gemini Embed 2 embeddings (768D)...")
@@ -1,13 +1,11 @@
 """Prompt evolution engine — versioned prompts with scoring and auto-evolution."""
 
 import json
-import sys
-from pathlib import Path
 from typing import Callable, Optional, List, Dict, Any
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
 from config import SUPABASE_URL, SUPABASE_KEY, PROMPT_AUTO_EVOLVE_THRESHOLD, PROMPT_PASSING_THRESHOLD, MAX_EVOLUTIONS_PER_RUN
 
+from postgrest.types import ReturnMethod
 from supabase import create_client
 
 
@@ -129,7 +127,9 @@ class PromptEvolver:
         new_text = self._heuristic_evolve(old_text, rejection_categories, feedback)
 
         # Deactivate parent
-        self.supabase.table("prompt_templates").update({"is_active": False}).eq("id", parent_prompt_id).execute()
+        self.supabase.table("prompt_templates").update(
+            {"is_active": False}, returning=ReturnMethod.minimal
+        ).eq("id", parent_prompt_id).execute()
 
         # Create new version
         new_version = parent_data["version"] + 1
@@ -158,7 +158,7 @@ class PromptEvolver:
             "reason": feedback or f"Score {score_before:.3f} below threshold",
             "rejection_categories": rejection_categories,
             "score_before": score_before,
-        }).execute()
+        }, returning=ReturnMethod.minimal).execute()
 
         self.evolutions_this_run += 1
         self.log("prompt", "info",
@@ -0,0 +1,81 @@
+"""run_logs batches via Postgres COPY instead of PostgREST.
+
+Log records are the worker's highest-volume write. Through PostgREST each
+batch is JSON-encoded, sent over HTTP and re-parsed into an INSERT; with a
+direct Postgres DSN configured, batches are instead streamed with
+``COPY run_logs ... FROM STDIN`` on one connection owned by the log writer
+thread. Status and artifact writes stay on PostgREST.
+
+psycopg is optional; without it (or without a DSN) logs go through
+PostgREST as before. A batch that fails over COPY is handed to the
+fallback writer, so a dropped connection never loses logs.
+"""
+
+import time
+from typing import Callable, List
+
+try:
+    import psycopg
+
+    COPY_AVAILABLE = True
+except ImportError:
+    COPY_AVAILABLE = False
+
+from log_writer import LogRecord
+
+COPY_SQL = "COPY run_logs (run_id, client_id, stage, level, message) FROM STDIN"
+
+# After a connection error, use the fallback for a while before retrying.
+RECONNECT_BACKOFF_SECONDS = 5.0
+
+
+class CopyLogSink:
+    """Writes log batches with COPY, falling back to another writer on error."""
+
+    def __init__(self, dsn: str, fallback: Callable[[List[LogRecord]], None]):
+        """
+        Initialize the sink; the connection opens lazily on first write.
+
+        Args:
+            dsn: Postgres connection string with INSERT rights on run_logs
+            fallback: Batch writer used while COPY is unavailable
+        """
+        self._dsn = dsn
+        self._fallback = fallback
+        self._conn = None
+        self._retry_at = 0.0
+
+    def write(self, batch: List[LogRecord]) -> None:
+        """Write one batch of (run_id, client_id, stage, level, message) records."""
+        if self._conn is None and not self._connect():
+            self._fallback(batch)
+            return
+        try:
+            with self._conn.cursor().copy(COPY_SQL) as copy:
+                for record in batch:
+                    copy.write_row(record)
+        except psycopg.Error as e:
+            print(f"[Worker] COPY to run_logs failed, using PostgREST: {e}")
+            self.close()
+            self._retry_at = time.monotonic() + RECONNECT_BACKOFF_SECONDS
+            self._fallback(batch)
+
+    def close(self) -> None:
+        """Close the COPY connection, if open."""
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            try:
+                conn.close()
+            except psycopg.Error:
+                pass
+
+    def _connect(self) -> bool:
+        if time.monotonic() < self._retry_at:
+            return False
+        try:
+            self._conn = psycopg.connect(self._dsn, autocommit=True)
+        except psycopg.Error as e:
+            print(f"[Worker] Could not connect for run_logs COPY: {e}")
+            self._retry_at = time.monotonic() + RECONNECT_BACKOFF_SECONDS
+            return False
+        return True
@@ -0,0 +1,104 @@
+"""Background run-log writer — keeps run_logs inserts off the run threads.
+
+Executors log many lines per run, and each ``run_logs`` insert is a
+Supabase round-trip. Doing that inline made every log call block the
+executor (and, during streaming, the subprocess pipe drain) for one RTT.
+Records are instead queued and written by a single daemon thread, in the
+order they were logged, as multi-row inserts: whatever accumulates within
+FLUSH_INTERVAL_SECONDS of the first pending record (up to BATCH_MAX_ROWS)
+goes out in one call. A failed batch is retried once before it is dropped;
+the optional ``echo`` step (console output) runs once per batch, outside
+the retry.
+"""
+
+import queue
+import threading
+import time
+from typing import Callable, List, Optional, Tuple
+
+LogRecord = Tuple[str, str, str, str, str]  # (run_id, client_id, stage, level, message)
+
+BATCH_MAX_ROWS = 50
+# Short enough that the HUD's live log view still feels live.
+FLUSH_INTERVAL_SECONDS = 0.5
+# One retry rides out a transient PostgREST/network blip without letting a
+# hard failure back the queue up indefinitely.
+RETRY_DELAY_SECONDS = 1.0
+
+_STOP = object()
+
+
+class LogWriter:
+    """Single-threaded FIFO writer that flushes run log records in batches."""
+
+    def __init__(
+        self,
+        write_batch: Callable[[List[LogRecord]], None],
+        echo: Optional[Callable[[List[LogRecord]], None]] = None,
+    ):
+        """
+        Start the writer thread.
+
+        Args:
+            write_batch: Called with a non-empty list of
+                (run_id, client_id, stage, level, message) records, oldest
+                first; a batch that raises is retried once, then reported
+                and dropped — exceptions never propagate
+            echo: Optional; called once with each batch before it is
+                written, and never retried
+        """
+        self._write_batch = write_batch
+        self._echo = echo
+        self._queue: "queue.SimpleQueue[object]" = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._drain, name="run-log-writer", daemon=True)
+        self._thread.start()
+
+    def put(self, run_id: str, client_id: str, stage: str, level: str, message: str) -> None:
+        """Queue one record; returns immediately."""
+        self._queue.put((run_id, client_id, stage, level, message))
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Flush queued records and stop the writer thread."""
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    def _drain(self) -> None:
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            if first is _STOP:
+                return
+
+            batch = [first]
+            deadline = time.monotonic() + FLUSH_INTERVAL_SECONDS
+            while len(batch) < BATCH_MAX_ROWS:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    record = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if record is _STOP:
+                    stopping = True
+                    break
+                batch.append(record)
+
+            self._write(batch)
+
+    def _write(self, batch: List[LogRecord]) -> None:
+        if self._echo is not None:
+            try:
+                self._echo(batch)
+            except Exception as e:
+                print(f"[Worker] Error echoing {len(batch)} log(s): {e}")
+        try:
+            self._write_batch(batch)
+            return
+        except Exception as e:
+            print(f"[Worker] Error writing {len(batch)} log(s), retrying: {e}")
+        time.sleep(RETRY_DELAY_SECONDS)
+        try:
+            self._write_batch(batch)
+        except Exception as e:
+            print(f"[Worker] Error writing {len(batch)} log(s), dropped: {e}")
@@ -0,0 +1,65 @@
+"""Bounded run pool — lets a single worker process drive several runs at once.
+
+Runs spend almost all of their wall time waiting on tool subprocesses or
+remote APIs (Gemini, Veo, Pinecone, Supabase), so a thread pool is enough:
+the Python side is I/O-bound and the heavy compute lives in the children.
+"""
+
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List
+
+
+class RunPool:
+    """Thread pool that tracks which run IDs are currently in flight."""
+
+    def __init__(self, max_workers: int):
+        """
+        Initialize the pool.
+
+        Args:
+            max_workers: Maximum number of runs executing concurrently
+        """
+        self.max_workers = max(1, max_workers)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="run"
+        )
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, Future] = {}
+
+    def has_capacity(self) -> bool:
+        """Whether another run can start without queueing."""
+        return self.free_slots() > 0
+
+    def free_slots(self) -> int:
+        """How many more runs can start without queueing."""
+        with self._lock:
+            return max(0, self.max_workers - len(self._in_flight))
+
+    def in_flight_ids(self) -> List[str]:
+        """Snapshot of run IDs currently executing."""
+        with self._lock:
+            return list(self._in_flight)
+
+    def submit(self, run_id: str, fn: Callable[..., None], *args) -> Future:
+        """Schedule ``fn(*args)`` for ``run_id`` and track it until done."""
+        future = self._executor.submit(fn, *args)
+        with self._lock:
+            self._in_flight[run_id] = future
+        future.add_done_callback(lambda _f: self._discard(run_id))
+        return future
+
+    def wait_for_slot(self, timeout: float) -> None:
+        """Block until at least one in-flight run finishes, or ``timeout``."""
+        with self._lock:
+            futures = list(self._in_flight.values())
+        if futures:
+            wait(futures, timeout=timeout, return_when=FIRST_COMPLETED)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting runs; optionally wait for in-flight ones to finish."""
+        self._executor.shutdown(wait=wait)
+
+    def _discard(self, run_id: str) -> None:
+        with self._lock:
+            self._in_flight.pop(run_id, None)
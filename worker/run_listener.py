@@ -0,0 +1,90 @@
+"""Pending-run wake-ups via Postgres LISTEN/NOTIFY.
+
+Migration 024 makes the database ``pg_notify('runs_pending', id)`` whenever
+a run enters 'pending'. With a direct Postgres DSN configured, the worker
+blocks on that channel between claims instead of re-querying PostgREST
+every POLL_INTERVAL_SECONDS, so idle workers stay quiet and new runs are
+picked up as soon as their insert commits.
+
+psycopg is optional; without it (or without a DSN) the worker polls as
+before.
+"""
+
+import time
+
+try:
+    import psycopg
+
+    LISTEN_AVAILABLE = True
+except ImportError:
+    LISTEN_AVAILABLE = False
+
+CHANNEL = "runs_pending"
+
+# After a connection error, don't hammer the database with reconnects.
+RECONNECT_BACKOFF_SECONDS = 5.0
+
+
+class PendingRunListener:
+    """Blocks until a pending-run notification arrives (or a timeout)."""
+
+    def __init__(self, dsn: str):
+        """
+        Initialize the listener; the connection opens lazily on first wait.
+
+        Args:
+            dsn: Session-level Postgres connection string (direct connection or
+                session-mode pooler — transaction mode drops notifications)
+        """
+        self._dsn = dsn
+        self._conn = None
+        self._retry_at = 0.0
+
+    @property
+    def connected(self) -> bool:
+        """Whether the LISTEN connection is currently open."""
+        return self._conn is not None
+
+    def wait(self, timeout: float) -> bool:
+        """
+        Wait up to ``timeout`` seconds for a notification.
+
+        Returns:
+            True if woken by a notification, False on timeout or while the
+            connection is down (the caller should then poll as usual)
+        """
+        if self._conn is None and not self._connect():
+            time.sleep(timeout)
+            return False
+        try:
+            for _ in self._conn.notifies(timeout=timeout, stop_after=1):
+                return True
+            return False
+        except psycopg.Error as e:
+            print(f"[Worker] LISTEN connection lost: {e}")
+            self.close()
+            self._retry_at = time.monotonic() + RECONNECT_BACKOFF_SECONDS
+            return False
+
+    def close(self) -> None:
+        """Close the LISTEN connection, if open."""
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            try:
+                conn.close()
+            except psycopg.Error:
+                pass
+
+    def _connect(self) -> bool:
+        if time.monotonic() < self._retry_at:
+            return False
+        try:
+            conn = psycopg.connect(self._dsn, autocommit=True)
+            conn.execute(f"LISTEN {CHANNEL}")
+        except psycopg.Error as e:
+            print(f"[Worker] Could not LISTEN for pending runs: {e}")
+            self._retry_at = time.monotonic() + RECONNECT_BACKOFF_SECONDS
+            return False
+        self._conn = conn
+        print(f"[Worker] Listening for pending runs on '{CHANNEL}'")
+        return True
@@ -0,0 +1,126 @@
+"""Unit tests for CreativeExecutor's in-process Gemini image path and prompt cache.
+
+A stub client stands in for google-genai, so no API key or network is
+needed.
+
+Usage:
+    python -m worker.tests.test_creative_direct_genai
+
+Or under pytest:
+    pytest worker/tests/test_creative_direct_genai.py -v
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+
+WORKER_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if WORKER_ROOT not in sys.path:
+    sys.path.insert(0, WORKER_ROOT)
+
+from executors import creative  # noqa: E402
+
+
+def _response(*parts) -> SimpleNamespace:
+    return SimpleNamespace(
+        candidates=[SimpleNamespace(content=SimpleNamespace(parts=list(parts)))]
+    )
+
+
+def _part(data=None) -> SimpleNamespace:
+    inline = SimpleNamespace(data=data) if data is not None else None
+    return SimpleNamespace(inline_data=inline)
+
+
+class DirectGenaiTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.logs: list = []
+        self.executor = creative.CreativeExecutor(
+            lambda stage, level, msg: self.logs.append((level, msg))
+        )
+        self.executor._genai = mock.MagicMock()
+        patcher = mock.patch.object(
+            creative,
+            "output_file_path",
+            lambda _client, _kind, name: os.path.join(self.tmp.name, name),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_writes_inline_image_without_spawning_tool(self) -> None:
+        self.executor._genai.models.generate_content.return_value = _response(
+            _part(), _part(b"PNGDATA")
+        )
+        with mock.patch.object(self.executor, "_run_tool") as run_tool:
+            result = self.executor.generate_image("run1", "client_x", "a chair", "out.png")
+
+        run_tool.assert_not_called()
+        self.assertEqual(result["status"], "completed")
+        self.assertEqual(
+            result["artifacts"][0]["metadata"]["model"], creative.CREATIVE_IMAGE_MODEL
+        )
+        with open(result["artifacts"][0]["path"], "rb") as f:
+            self.assertEqual(f.read(), b"PNGDATA")
+
+    def test_default_names_are_unique_per_run(self) -> None:
+        self.executor._genai.models.generate_content.return_value = _response(
+            _part(b"PNGDATA")
+        )
+        with mock.patch.object(creative.time, "time", return_value=1_700_000_000):
+            first = self.executor.generate_image("run1", "client_x", "a chair")
+            second = self.executor.generate_image("run2", "client_x", "a chair")
+
+        self.assertNotEqual(first["artifacts"][0]["path"], second["artifacts"][0]["path"])
+
+    def test_response_without_image_fails_run(self) -> None:
+        self.executor._genai.models.generate_content.return_value = _response(_part())
+        result = self.executor.generate_image("run1", "client_x", "a chair", "out.png")
+        self.assertEqual(result["status"], "failed")
+        self.assertIn("no image data", result["error"])
+
+    def test_falls_back_to_tool_when_client_absent(self) -> None:
+        self.executor._genai = None
+        done = mock.Mock(returncode=0, stderr="")
+        with mock.patch.object(self.executor, "_run_tool", return_value=done) as run_tool:
+            result = self.executor.generate_image("run1", "client_x", "a chair", "out.png")
+
+        run_tool.assert_called_once()
+        self.assertEqual(result["status"], "completed")
+        self.assertEqual(
+            result["artifacts"][0]["metadata"]["model"], creative.TEMP_GEN_IMAGE_MODEL
+        )
+
+    def test_identical_prompt_is_served_from_cache(self) -> None:
+        self.executor._genai.models.generate_content.return_value = _response(
+            _part(b"PNGDATA")
+        )
+        cache_file = os.path.join(self.tmp.name, "_cache", "slot.png")
+        with mock.patch.object(creative, "CREATIVE_IMAGE_CACHE", True), \
+                mock.patch.object(creative, "image_cache_path", lambda _c, _p: cache_file):
+            first = self.executor.generate_image("run1", "client_x", "a chair", "first.png")
+            second = self.executor.generate_image("run2", "client_x", "a chair", "second.png")
+
+        self.assertEqual(self.executor._genai.models.generate_content.call_count, 1)
+        self.assertEqual(second["status"], "completed")
+        self.assertNotIn("cached", first["artifacts"][0]["metadata"])
+        self.assertTrue(second["artifacts"][0]["metadata"]["cached"])
+        with open(second["artifacts"][0]["path"], "rb") as f:
+            self.assertEqual(f.read(), b"PNGDATA")
+
+
+def main() -> int:
+    suite = unittest.TestLoader().loadTestsFromTestCase(DirectGenaiTests)
+    result = unittest.TextTestRunner(verbosity=2).run(suite)
+    return 0 if result.wasSuccessful() else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,76 @@
+"""Unit tests for the Worker's ``full`` mode stage scheduling.
+
+Executors are replaced with fakes, so no tools, network or credentials are
+needed.
+
+Usage:
+    python -m worker.tests.test_full_pipeline
+
+Or under pytest:
+    pytest worker/tests/test_full_pipeline.py -v
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import unittest
+from unittest import mock
+
+
+WORKER_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if WORKER_ROOT not in sys.path:
+    sys.path.insert(0, WORKER_ROOT)
+
+import worker as worker_module  # noqa: E402
+
+
+class _FakeCreative:
+    """Images and video each wait for the other to have started."""
+
+    def __init__(self, _log_cb) -> None:
+        self.started = {"images": threading.Event(), "video": threading.Event()}
+
+    def execute(self, run_id, client_id, mode, params) -> dict:
+        self.started[mode].set()
+        other = "video" if mode == "images" else "images"
+        if not self.started[other].wait(5):
+            raise AssertionError(f"{mode} ran without {other} overlapping it")
+        return {"status": "completed", "artifacts": [{"type": mode, "name": mode, "path": mode}]}
+
+
+class FullPipelineTests(unittest.TestCase):
+    def test_images_and_video_overlap(self) -> None:
+        w = worker_module.Worker.__new__(worker_module.Worker)
+        w.log_writer = mock.MagicMock()
+        w._finalize_run = mock.MagicMock()
+
+        ingest = mock.MagicMock()
+        ingest.return_value.execute.return_value = {"status": "completed"}
+        grading = mock.MagicMock()
+        grading.return_value.execute.return_value = {
+            "status": "completed", "artifacts": [{"type": "report", "name": "r", "path": "r"}],
+        }
+        with mock.patch.multiple(
+            worker_module.executors,
+            IngestExecutor=ingest,
+            CreativeExecutor=_FakeCreative,
+            GradingExecutor=grading,
+        ):
+            w._execute_run({"id": "run1", "client_id": "client_x", "mode": "full"})
+
+        run_id, status, error, hitl, artifacts = w._finalize_run.call_args.args
+        self.assertEqual((run_id, status, error, hitl), ("run1", "completed", None, False))
+        self.assertEqual(w._finalize_run.call_args.kwargs["client_id"], "client_x")
+        self.assertEqual([a["type"] for a in artifacts], ["images", "video", "report"])
+
+
+def main() -> int:
+    suite = unittest.TestLoader().loadTestsFromTestCase(FullPipelineTests)
+    result = unittest.TextTestRunner(verbosity=2).run(suite)
+    return 0 if result.wasSuccessful() else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
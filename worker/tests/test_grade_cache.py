@@ -0,0 +1,158 @@
+"""Unit tests for GradingExecutor's content-keyed grade cache and sample-image lookup.
+
+The BrandGrader is replaced with a mock, so no API keys or Pinecone
+access are needed (brand-engine itself must be importable).
+
+Usage:
+    python -m worker.tests.test_grade_cache
+
+Or under pytest:
+    pytest worker/tests/test_grade_cache.py -v
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+WORKER_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if WORKER_ROOT not in sys.path:
+    sys.path.insert(0, WORKER_ROOT)
+
+from executors import grading  # noqa: E402
+
+
+def _grade_result():
+    from brand_engine.core.models import FusionResult, GradeResult, ModalScore
+
+    score = ModalScore(model="gemini", raw_score=0.8, z_score=1.0, top_k_ids=[])
+    fusion = FusionResult(
+        gemini_score=score,
+        cohere_score=score.model_copy(update={"model": "cohere"}),
+        combined_z=1.0,
+        gate_decision="AUTO_PASS",
+        confidence=0.9,
+    )
+    return GradeResult(
+        fusion=fusion, gate_decision="AUTO_PASS", hitl_required=False, summary="ok"
+    )
+
+
+@unittest.skipUnless(grading.BRAND_ENGINE_AVAILABLE, "brand-engine not importable")
+class GradeCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        grading._GRADE_CACHE.clear()
+        self.addCleanup(grading._GRADE_CACHE.clear)
+
+        self.profile = self._profile(1.0)
+        for target, value in (
+            ("load_brand_profile", lambda *_a, **_k: self.profile),
+            ("output_file_path", lambda _c, _k, name: os.path.join(self.tmp.name, name)),
+        ):
+            patcher = mock.patch.object(grading, target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.executor = grading.GradingExecutor(lambda *_args: None)
+        self.executor._grader = mock.Mock()
+        self.executor._grader.grade.return_value = _grade_result()
+
+    @staticmethod
+    def _profile(auto_pass_z: float):
+        from brand_engine.core.models import BrandProfile, BrandThresholds
+
+        return BrandProfile(
+            brand_slug="brand",
+            display_name="Brand",
+            thresholds=BrandThresholds(auto_pass_z=auto_pass_z),
+        )
+
+    def _image(self, name: str, data: bytes) -> str:
+        path = os.path.join(self.tmp.name, name)
+        with open(path, "wb") as f:
+            f.write(data)
+        return path
+
+    def _grade(self, image_path: str) -> dict:
+        return self.executor.execute("run1", "client_brand", {"image_path": image_path})
+
+    def test_identical_content_is_graded_once(self) -> None:
+        first = self._grade(self._image("a.png", b"same"))
+        second = self._grade(self._image("b.png", b"same"))
+        self.assertEqual(self.executor._grader.grade.call_count, 1)
+        self.assertEqual(first["grade_decision"], second["grade_decision"])
+
+    def test_different_content_is_graded_again(self) -> None:
+        self._grade(self._image("a.png", b"one"))
+        self._grade(self._image("b.png", b"two"))
+        self.assertEqual(self.executor._grader.grade.call_count, 2)
+
+    def test_invalidation_forces_regrade(self) -> None:
+        path = self._image("a.png", b"same")
+        self._grade(path)
+        grading.invalidate_grade_cache("brand")
+        self._grade(path)
+        self.assertEqual(self.executor._grader.grade.call_count, 2)
+
+    def test_profile_edit_forces_regrade(self) -> None:
+        path = self._image("a.png", b"same")
+        self._grade(path)
+        self.profile = self._profile(1.2)
+        self._grade(path)
+        self.assertEqual(self.executor._grader.grade.call_count, 2)
+
+    def test_expired_entry_is_regraded(self) -> None:
+        path = self._image("a.png", b"same")
+        self._grade(path)
+        with mock.patch.object(
+            grading.time, "monotonic",
+            return_value=grading.time.monotonic() + grading.GRADE_CACHE_TTL_SECONDS,
+        ):
+            self._grade(path)
+        self.assertEqual(self.executor._grader.grade.call_count, 2)
+
+
+class SampleImageTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        grading._SAMPLE_IMAGES.clear()
+        self.addCleanup(grading._SAMPLE_IMAGES.clear)
+        patcher = mock.patch.object(grading, "BRAND_ASSETS_BASE", Path(self.tmp.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_missing_folder_is_rechecked_until_found(self) -> None:
+        self.assertIsNone(grading._find_sample_image("brand"))
+
+        folder = Path(self.tmp.name, "brand", "reference_images")
+        folder.mkdir(parents=True)
+        (folder / "hero.png").write_bytes(b"png")
+
+        self.assertEqual(grading._find_sample_image("brand"), str(folder / "hero.png"))
+        with mock.patch.object(grading.os, "scandir") as scandir:
+            grading._find_sample_image("brand")
+        scandir.assert_not_called()
+
+
+def main() -> int:
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite(
+        [
+            loader.loadTestsFromTestCase(GradeCacheTests),
+            loader.loadTestsFromTestCase(SampleImageTests),
+        ]
+    )
+    result = unittest.TextTestRunner(verbosity=2).run(suite)
+    return 0 if result.wasSuccessful() else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,77 @@
+"""Unit tests for log_copy.CopyLogSink — COPY with a PostgREST fallback.
+
+psycopg.connect is patched, so no database is needed.
+
+Usage:
+    python -m worker.tests.test_log_copy
+
+Or under pytest:
+    pytest worker/tests/test_log_copy.py -v
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+
+WORKER_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if WORKER_ROOT not in sys.path:
+    sys.path.insert(0, WORKER_ROOT)
+
+import log_copy  # noqa: E402
+
+BATCH = [
+    ("run1", "client1", "system", "info", "a"),
+    ("run1", "client1", "system", "warn", "b"),
+]
+
+
+@unittest.skipUnless(log_copy.COPY_AVAILABLE, "psycopg not installed")
+class CopyLogSinkTests(unittest.TestCase):
+    def test_streams_batch_over_copy(self) -> None:
+        fallback = mock.MagicMock()
+        with mock.patch.object(log_copy.psycopg, "connect") as connect:
+            sink = log_copy.CopyLogSink("postgresql://x", fallback)
+            sink.write(BATCH)
+            sink.write(BATCH)
+
+        connect.assert_called_once()  # connection reused across batches
+        cursor = connect.return_value.cursor.return_value
+        cursor.copy.assert_called_with(log_copy.COPY_SQL)
+        copy = cursor.copy.return_value.__enter__.return_value
+        self.assertEqual([c.args[0] for c in copy.write_row.call_args_list], BATCH * 2)
+        fallback.assert_not_called()
+
+    def test_copy_error_falls_back_and_backs_off(self) -> None:
+        fallback = mock.MagicMock()
+        with mock.patch.object(log_copy.psycopg, "connect") as connect:
+            connect.return_value.cursor.return_value.copy.side_effect = (
+                log_copy.psycopg.OperationalError("connection lost")
+            )
+            sink = log_copy.CopyLogSink("postgresql://x", fallback)
+            sink.write(BATCH)
+            sink.write(BATCH)  # within the backoff window: no reconnect
+
+        connect.assert_called_once()
+        self.assertEqual(fallback.call_args_list, [mock.call(BATCH), mock.call(BATCH)])
+
+    def test_connect_error_uses_fallback(self) -> None:
+        fallback = mock.MagicMock()
+        with mock.patch.object(
+            log_copy.psycopg, "connect", side_effect=log_copy.psycopg.OperationalError("down")
+        ):
+            log_copy.CopyLogSink("postgresql://x", fallback).write(BATCH)
+        fallback.assert_called_once_with(BATCH)
+
+
+def main() -> int:
+    suite = unittest.TestLoader().loadTestsFromTestCase(CopyLogSinkTests)
+    result = unittest.TextTestRunner(verbosity=2).run(suite)
+    return 0 if result.wasSuccessful() else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
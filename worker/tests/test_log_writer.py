@@ -0,0 +1,108 @@
+"""Unit tests for log_writer.LogWriter.
+
+Usage:
+    python -m worker.tests.test_log_writer
+
+Or under pytest:
+    pytest worker/tests/test_log_writer.py -v
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+import unittest
+from unittest import mock
+
+
+WORKER_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if WORKER_ROOT not in sys.path:
+    sys.path.insert(0, WORKER_ROOT)
+
+import log_writer  # noqa: E402
+from log_writer import BATCH_MAX_ROWS, LogWriter  # noqa: E402
+
+
+class LogWriterTests(unittest.TestCase):
+    def test_put_does_not_wait_for_write(self) -> None:
+        release = threading.Event()
+        written: list = []
+
+        def slow_write(batch) -> None:
+            release.wait(5)
+            written.extend(batch)
+
+        writer = LogWriter(slow_write)
+        writer.put("run1", "client1", "system", "info", "hello")  # would block if inline
+        self.assertEqual(written, [])
+        release.set()
+        writer.close(timeout=5)
+        self.assertEqual(written, [("run1", "client1", "system", "info", "hello")])
+
+    def test_close_flushes_in_order(self) -> None:
+        written: list = []
+        writer = LogWriter(lambda batch: written.extend(r[4] for r in batch))
+        for i in range(100):
+            writer.put("run1", "client1", "system", "info", str(i))
+        writer.close(timeout=5)
+        self.assertEqual(written, [str(i) for i in range(100)])
+
+    def test_records_are_written_in_batches(self) -> None:
+        batches: list = []
+        writer = LogWriter(batches.append)
+        for i in range(BATCH_MAX_ROWS * 2):
+            writer.put("run1", "client1", "system", "info", str(i))
+        writer.close(timeout=5)
+        self.assertLessEqual(len(batches), 3)
+        self.assertTrue(all(len(b) <= BATCH_MAX_ROWS for b in batches))
+        self.assertEqual(sum(len(b) for b in batches), BATCH_MAX_ROWS * 2)
+
+    def test_failed_batch_is_retried_once(self) -> None:
+        calls: list = []
+
+        def flaky_write(batch) -> None:
+            calls.append([r[4] for r in batch])
+            if len(calls) == 1:
+                raise RuntimeError("insert failed")
+
+        echoed: list = []
+        with mock.patch.object(log_writer, "RETRY_DELAY_SECONDS", 0):
+            writer = LogWriter(flaky_write, echo=lambda batch: echoed.extend(batch))
+            writer.put("run1", "client1", "system", "info", "a")
+            writer.close(timeout=5)
+        self.assertEqual(calls, [["a"], ["a"]])
+        self.assertEqual(len(echoed), 1)  # the retry doesn't echo again
+
+    def test_write_errors_do_not_stop_the_writer(self) -> None:
+        written: list = []
+        calls: list = []
+
+        def flaky_write(batch) -> None:
+            calls.append(batch)
+            if batch[0][4] == "bad":
+                raise RuntimeError("insert failed")
+            written.extend(r[4] for r in batch)
+
+        with mock.patch.object(log_writer, "RETRY_DELAY_SECONDS", 0):
+            writer = LogWriter(flaky_write)
+            writer.put("run1", "client1", "system", "info", "bad")
+            for _ in range(100):  # let the first batch fail (twice) on its own
+                if len(calls) >= 2:
+                    break
+                time.sleep(0.05)
+            writer.put("run1", "client1", "system", "info", "good")
+            writer.close(timeout=5)
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(written, ["good"])
+
+
+def main() -> int:
+    suite = unittest.TestLoader().loadTestsFromTestCase(LogWriterTests)
+    result = unittest.TextTestRunner(verbosity=2).run(suite)
+    return 0 if result.wasSuccessful() else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
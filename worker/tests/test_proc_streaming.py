@@ -0,0 +1,121 @@
+"""Unit tests for executors._proc.run_streaming.
+
+Spawns small ``python -c`` children so the helper is exercised against
+real pipes — no Supabase, tool venvs, or brand-engine required.
+
+Usage:
+    python -m worker.tests.test_proc_streaming
+
+Or under pytest:
+    pytest worker/tests/test_proc_streaming.py -v
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import time
+import unittest
+from unittest import mock
+
+
+WORKER_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if WORKER_ROOT not in sys.path:
+    sys.path.insert(0, WORKER_ROOT)
+
+from executors._proc import STDERR_TAIL_BYTES, run_streaming  # noqa: E402
+
+
+def _py(code: str) -> list:
+    return [sys.executable, "-c", code]
+
+
+class RunStreamingTests(unittest.TestCase):
+    def test_streams_non_empty_stdout_lines(self) -> None:
+        lines: list = []
+        result = run_streaming(
+            _py("print('one'); print(''); print('  two  '); print('three', end='')"),
+            cwd=WORKER_ROOT,
+            timeout=30,
+            on_line=lines.append,
+        )
+        self.assertEqual(result.returncode, 0)
+        self.assertEqual(lines, ["one", "two", "three"])
+
+    def test_lines_arrive_before_child_exits(self) -> None:
+        seen_at: list = []
+        start = time.monotonic()
+        run_streaming(
+            _py("import sys, time; print('early'); sys.stdout.flush(); time.sleep(1.0)"),
+            cwd=WORKER_ROOT,
+            timeout=30,
+            on_line=lambda _line: seen_at.append(time.monotonic() - start),
+        )
+        self.assertEqual(len(seen_at), 1)
+        self.assertLess(seen_at[0], 0.9)
+
+    def test_collects_stderr_and_returncode(self) -> None:
+        result = run_streaming(
+            _py("import sys; sys.stderr.write('boom'); sys.exit(3)"),
+            cwd=WORKER_ROOT,
+            timeout=30,
+            on_line=lambda _line: None,
+        )
+        self.assertEqual(result.returncode, 3)
+        self.assertEqual(result.stderr, "boom")
+
+    def test_stderr_is_tail_bounded(self) -> None:
+        result = run_streaming(
+            _py(
+                "import sys; sys.stderr.write('x' * %d + 'END'); sys.exit(1)"
+                % (STDERR_TAIL_BYTES * 4)
+            ),
+            cwd=WORKER_ROOT,
+            timeout=30,
+            on_line=lambda _line: None,
+        )
+        self.assertEqual(len(result.stderr), STDERR_TAIL_BYTES)
+        self.assertTrue(result.stderr.endswith("END"))
+
+    def test_timeout_kills_child(self) -> None:
+        start = time.monotonic()
+        with self.assertRaises(subprocess.TimeoutExpired):
+            run_streaming(
+                _py("import time; time.sleep(30)"),
+                cwd=WORKER_ROOT,
+                timeout=0.5,
+                on_line=lambda _line: None,
+            )
+        self.assertLess(time.monotonic() - start, 5)
+
+    def test_callback_error_kills_and_reaps_child(self) -> None:
+        procs = []
+        real_popen = subprocess.Popen
+
+        def popen(*args, **kwargs):
+            procs.append(real_popen(*args, **kwargs))
+            return procs[-1]
+
+        def on_line(_line):
+            raise RuntimeError("log sink down")
+
+        with mock.patch.object(subprocess, "Popen", popen):
+            with self.assertRaises(RuntimeError):
+                run_streaming(
+                    _py("import sys, time; print('hi'); sys.stdout.flush(); time.sleep(30)"),
+                    cwd=WORKER_ROOT,
+                    timeout=10,
+                    on_line=on_line,
+                )
+        self.assertIsNotNone(procs[0].returncode)  # killed and reaped
+
+
+def main() -> int:
+    suite = unittest.TestLoader().loadTestsFromTestCase(RunStreamingTests)
+    result = unittest.TextTestRunner(verbosity=2).run(suite)
+    return 0 if result.wasSuccessful() else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
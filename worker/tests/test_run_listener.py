@@ -0,0 +1,79 @@
+"""Unit tests for run_listener.PendingRunListener.
+
+A fake connection stands in for psycopg's, so no database is needed.
+
+Usage:
+    python -m worker.tests.test_run_listener
+
+Or under pytest:
+    pytest worker/tests/test_run_listener.py -v
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+
+WORKER_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if WORKER_ROOT not in sys.path:
+    sys.path.insert(0, WORKER_ROOT)
+
+import run_listener  # noqa: E402
+from run_listener import PendingRunListener  # noqa: E402
+
+
+class _FakeConn:
+    def __init__(self, notes=(), error=None):
+        self._notes = list(notes)
+        self._error = error
+        self.closed = False
+
+    def notifies(self, timeout=None, stop_after=None):
+        if self._error:
+            raise self._error
+        yield from self._notes[:stop_after]
+
+    def close(self):
+        self.closed = True
+
+
+@unittest.skipUnless(run_listener.LISTEN_AVAILABLE, "psycopg not installed")
+class PendingRunListenerTests(unittest.TestCase):
+    def _listener(self, conn) -> PendingRunListener:
+        listener = PendingRunListener("postgresql://unused")
+        listener._conn = conn
+        return listener
+
+    def test_notification_wakes_waiter(self) -> None:
+        listener = self._listener(_FakeConn(notes=["run-1"]))
+        self.assertTrue(listener.wait(0.1))
+
+    def test_timeout_returns_false(self) -> None:
+        listener = self._listener(_FakeConn())
+        self.assertFalse(listener.wait(0.1))
+
+    def test_connection_error_drops_connection_and_backs_off(self) -> None:
+        conn = _FakeConn(error=run_listener.psycopg.OperationalError("gone"))
+        listener = self._listener(conn)
+
+        self.assertFalse(listener.wait(0.1))
+        self.assertTrue(conn.closed)
+        self.assertFalse(listener.connected)
+
+        with mock.patch.object(run_listener.psycopg, "connect") as connect, \
+                mock.patch.object(run_listener.time, "sleep"):
+            self.assertFalse(listener.wait(0.1))
+        connect.assert_not_called()  # still inside the reconnect backoff
+
+
+def main() -> int:
+    suite = unittest.TestLoader().loadTestsFromTestCase(PendingRunListenerTests)
+    result = unittest.TextTestRunner(verbosity=2).run(suite)
+    return 0 if result.wasSuccessful() else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
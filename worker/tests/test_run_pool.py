@@ -0,0 +1,67 @@
+"""Unit tests for pool.RunPool — in-flight tracking and slot accounting.
+
+Usage:
+    python -m worker.tests.test_run_pool
+
+Or under pytest:
+    pytest worker/tests/test_run_pool.py -v
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import unittest
+
+
+WORKER_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if WORKER_ROOT not in sys.path:
+    sys.path.insert(0, WORKER_ROOT)
+
+from pool import RunPool  # noqa: E402
+
+
+class RunPoolTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.pool = RunPool(2)
+
+    def tearDown(self) -> None:
+        self.pool.shutdown(wait=True)
+
+    def test_tracks_in_flight_and_capacity(self) -> None:
+        release = threading.Event()
+        self.pool.submit("run-a", release.wait)
+        self.assertTrue(self.pool.has_capacity())
+        self.assertEqual(self.pool.free_slots(), 1)
+        self.pool.submit("run-b", release.wait)
+        self.assertFalse(self.pool.has_capacity())
+        self.assertEqual(self.pool.free_slots(), 0)
+        self.assertCountEqual(self.pool.in_flight_ids(), ["run-a", "run-b"])
+
+        release.set()
+        self.pool.wait_for_slot(timeout=5)
+        self.pool.shutdown(wait=True)
+        self.assertEqual(self.pool.in_flight_ids(), [])
+        self.assertTrue(self.pool.has_capacity())
+
+    def test_runs_execute_concurrently(self) -> None:
+        barrier = threading.Barrier(2, timeout=5)
+        a = self.pool.submit("run-a", barrier.wait)
+        b = self.pool.submit("run-b", barrier.wait)
+        # Both would deadlock on the barrier if the pool serialized them.
+        a.result(timeout=5)
+        b.result(timeout=5)
+
+    def test_max_workers_floor_is_one(self) -> None:
+        self.assertEqual(RunPool(0).max_workers, 1)
+
+
+def main() -> int:
+    suite = unittest.TestLoader().loadTestsFromTestCase(RunPoolTests)
+    result = unittest.TextTestRunner(verbosity=2).run(suite)
+    return 0 if result.wasSuccessful() else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
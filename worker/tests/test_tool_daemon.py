@@ -0,0 +1,158 @@
+"""Unit tests for executors._daemon.ToolDaemon — the NDJSON job protocol.
+
+A tiny ``python -c`` serve loop stands in for Temp-gen's serve mode, so no
+tool venv is required.
+
+Usage:
+    python -m worker.tests.test_tool_daemon
+
+Or under pytest:
+    pytest worker/tests/test_tool_daemon.py -v
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import unittest
+
+
+WORKER_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if WORKER_ROOT not in sys.path:
+    sys.path.insert(0, WORKER_ROOT)
+
+from executors._daemon import DaemonPool, ToolDaemon, ToolDaemonError  # noqa: E402
+
+
+FAKE_SERVE = r"""
+import json, os, sys, time
+for raw in sys.stdin:
+    argv = json.loads(raw)["argv"]
+    op = argv[0]
+    if op == "die":
+        sys.exit(1)
+    if op == "sleep":
+        time.sleep(30)
+    print("plain text from " + op, flush=True)
+    print(json.dumps({"event": "log", "message": "pid=%d" % os.getpid()}), flush=True)
+    if op == "fail":
+        print(json.dumps({"event": "done", "ok": False, "error": "bad prompt"}), flush=True)
+    else:
+        print(json.dumps({"event": "done", "ok": True}), flush=True)
+"""
+
+
+class ToolDaemonTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.daemon = ToolDaemon([sys.executable, "-c", FAKE_SERVE], cwd=WORKER_ROOT)
+
+    def tearDown(self) -> None:
+        self.daemon.close()
+
+    def test_streams_logs_and_reuses_process(self) -> None:
+        lines: list = []
+        first = self.daemon.try_call(["ok"], timeout=10, on_line=lines.append)
+        second = self.daemon.try_call(["ok"], timeout=10, on_line=lines.append)
+        self.assertEqual(first.returncode, 0)
+        self.assertEqual(second.returncode, 0)
+        self.assertEqual(lines[0], "plain text from ok")
+        pids = [line for line in lines if line.startswith("pid=")]
+        self.assertEqual(len(pids), 2)
+        self.assertEqual(pids[0], pids[1], "daemon should stay warm between jobs")
+
+    def test_tool_error_maps_to_nonzero_returncode(self) -> None:
+        result = self.daemon.try_call(["fail"], timeout=10, on_line=lambda _l: None)
+        self.assertEqual(result.returncode, 1)
+        self.assertEqual(result.stderr, "bad prompt")
+
+    def test_busy_daemon_returns_none(self) -> None:
+        self.daemon._lock.acquire()
+        try:
+            self.assertIsNone(self.daemon.try_call(["ok"], 10, lambda _l: None))
+        finally:
+            self.daemon._lock.release()
+
+    def test_death_raises_and_respawns(self) -> None:
+        with self.assertRaises(ToolDaemonError):
+            self.daemon.try_call(["die"], timeout=10, on_line=lambda _l: None)
+        result = self.daemon.try_call(["ok"], timeout=10, on_line=lambda _l: None)
+        self.assertEqual(result.returncode, 0)
+
+    def test_timeout_kills_daemon(self) -> None:
+        with self.assertRaises(subprocess.TimeoutExpired):
+            self.daemon.try_call(["sleep"], timeout=0.5, on_line=lambda _l: None)
+        self.assertIsNone(self.daemon._proc)
+
+    def test_callback_error_discards_daemon_mid_job(self) -> None:
+        def on_line(_line):
+            raise RuntimeError("log sink down")
+
+        with self.assertRaises(RuntimeError):
+            self.daemon.try_call(["job1"], timeout=10, on_line=on_line)
+        self.assertIsNone(self.daemon._proc)
+
+        lines: list = []
+        result = self.daemon.try_call(["fail"], timeout=10, on_line=lines.append)
+        self.assertEqual(result.returncode, 1)
+        self.assertEqual(lines[0], "plain text from fail")
+
+    def test_unstartable_command_raises(self) -> None:
+        daemon = ToolDaemon(["/nonexistent/python"], cwd=WORKER_ROOT)
+        with self.assertRaises(ToolDaemonError):
+            daemon.try_call(["ok"], timeout=1, on_line=lambda _l: None)
+
+
+class DaemonPoolTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.pool = DaemonPool([sys.executable, "-c", FAKE_SERVE], cwd=WORKER_ROOT, size=2)
+
+    def tearDown(self) -> None:
+        self.pool.close()
+
+    def test_reuses_running_daemon_before_starting_another(self) -> None:
+        self.pool.try_call(["ok"], 10, lambda _l: None)
+        self.pool.try_call(["ok"], 10, lambda _l: None)
+        self.assertEqual(sum(d.is_running() for d in self.pool.daemons), 1)
+
+    def test_busy_member_falls_through_to_next(self) -> None:
+        first = self.pool.daemons[0]
+        first._lock.acquire()
+        try:
+            result = self.pool.try_call(["ok"], 10, lambda _l: None)
+        finally:
+            first._lock.release()
+        self.assertEqual(result.returncode, 0)
+        self.assertTrue(self.pool.daemons[1].is_running())
+
+    def test_prewarm_starts_every_member(self) -> None:
+        self.pool.prewarm()
+        self.assertTrue(all(d.is_running() for d in self.pool.daemons))
+        pid = self.pool.daemons[0]._proc.pid
+        self.pool.try_call(["ok"], 10, lambda _l: None)
+        self.assertEqual(self.pool.daemons[0]._proc.pid, pid)
+
+    def test_all_busy_returns_none(self) -> None:
+        for daemon in self.pool.daemons:
+            daemon._lock.acquire()
+        try:
+            self.assertIsNone(self.pool.try_call(["ok"], 10, lambda _l: None))
+        finally:
+            for daemon in self.pool.daemons:
+                daemon._lock.release()
+
+
+def main() -> int:
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite(
+        [
+            loader.loadTestsFromTestCase(ToolDaemonTests),
+            loader.loadTestsFromTestCase(DaemonPoolTests),
+        ]
+    )
+    result = unittest.TextTestRunner(verbosity=2).run(suite)
+    return 0 if result.wasSuccessful() else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
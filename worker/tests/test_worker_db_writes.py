@@ -0,0 +1,276 @@
+"""Unit tests for the Worker's Supabase write paths.
+
+The Supabase client is a MagicMock, so these check which calls the worker
+issues (and how many) without a network or credentials.
+
+Usage:
+    python -m worker.tests.test_worker_db_writes
+
+Or under pytest:
+    pytest worker/tests/test_worker_db_writes.py -v
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import sys
+import unittest
+from unittest import mock
+
+
+WORKER_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if WORKER_ROOT not in sys.path:
+    sys.path.insert(0, WORKER_ROOT)
+
+import worker as worker_module  # noqa: E402
+from postgrest.exceptions import APIError  # noqa: E402
+from postgrest.types import ReturnMethod  # noqa: E402
+
+
+def _worker() -> "worker_module.Worker":
+    # Bypass __init__ (creates a real client and installs signal handlers).
+    w = worker_module.Worker.__new__(worker_module.Worker)
+    w.supabase = mock.MagicMock()
+    w._claim_rpc_available = True
+    w._claim_batch_available = True
+    w._finalize_rpc_available = True
+    w._side_writes = mock.MagicMock()
+    w.log_sink = None
+    return w
+
+
+ARTIFACTS = [
+    {"type": "image", "name": f"img{i}.png", "path": f"/nonexistent/img{i}.png"}
+    for i in range(3)
+]
+
+
+class FinalizeRunTests(unittest.TestCase):
+    def test_artifacts_and_status_go_in_one_rpc(self) -> None:
+        w = _worker()
+
+        w._finalize_run(
+            "run1", "needs_review", None, True, ARTIFACTS, client_id=None, campaign_id="camp1"
+        )
+
+        name, params = w.supabase.rpc.call_args.args
+        self.assertEqual(name, "finalize_run")
+        self.assertEqual(params["p_run_id"], "run1")
+        self.assertEqual(params["p_status"], "needs_review")
+        self.assertTrue(params["p_hitl_required"])
+        rows = params["p_artifacts"]
+        self.assertEqual([r["name"] for r in rows], ["img0.png", "img1.png", "img2.png"])
+        self.assertTrue(all(r["campaign_id"] == "camp1" for r in rows))
+        self.assertEqual(len({r["id"] for r in rows}), 3)
+        w.supabase.table.assert_not_called()
+        w._side_writes.submit.assert_not_called()
+
+    def test_missing_rpc_falls_back_to_separate_writes(self) -> None:
+        w = _worker()
+        w.supabase.rpc.return_value.execute.side_effect = APIError(
+            {"code": "PGRST202", "message": "Could not find the function"}
+        )
+
+        w._finalize_run("run1", "completed", artifacts=ARTIFACTS, client_id="client_x")
+        w._finalize_run("run2", "completed", client_id="client_x")
+
+        w.supabase.rpc.assert_called_once()  # not retried once known missing
+        self.assertFalse(w._finalize_rpc_available)
+        tables = [c.args[0] for c in w.supabase.table.call_args_list]
+        self.assertEqual(tables, ["artifacts", "runs", "runs"])  # run2: no artifacts insert
+        insert = w.supabase.table.return_value.insert
+        self.assertEqual(insert.call_args.kwargs["returning"], ReturnMethod.minimal)
+        self.assertEqual(len(insert.call_args.args[0]), 3)
+
+    def test_failed_rpc_still_records_the_status(self) -> None:
+        w = _worker()
+        w.supabase.rpc.return_value.execute.side_effect = APIError(
+            {"code": "23503", "message": "foreign key violation"}
+        )
+
+        w._finalize_run("run1", "completed", client_id="client_x")
+
+        self.assertTrue(w._finalize_rpc_available)
+        w.supabase.table.assert_called_once_with("runs")
+
+
+class ClaimTests(unittest.TestCase):
+    def test_claims_through_rpc_in_one_call(self) -> None:
+        w = _worker()
+        w.supabase.rpc.return_value.execute.return_value.data = [
+            {"id": "run1", "mode": "images", "status": "running"}
+        ]
+
+        runs = w._claim_pending_runs()
+
+        self.assertEqual([r["id"] for r in runs], ["run1"])
+        name, params = w.supabase.rpc.call_args.args
+        self.assertEqual(name, "claim_next_run")
+        self.assertEqual(params, {"p_excluded_modes": ["regrade", "stills"]})
+        w.supabase.table.assert_not_called()
+
+    def test_batch_claim_passes_limit(self) -> None:
+        w = _worker()
+        w.supabase.rpc.return_value.execute.return_value.data = [
+            {"id": "run1", "mode": "images"}, {"id": "run2", "mode": "video"},
+        ]
+
+        runs = w._claim_pending_runs(4)
+
+        self.assertEqual([r["id"] for r in runs], ["run1", "run2"])
+        w.supabase.rpc.assert_called_once()
+        self.assertEqual(w.supabase.rpc.call_args.args[1]["p_limit"], 4)
+
+    def test_missing_batch_form_falls_back_to_single_claims(self) -> None:
+        w = _worker()
+        w.supabase.rpc.return_value.execute.side_effect = [
+            APIError({"code": "PGRST202", "message": "Could not find the function"}),
+            mock.Mock(data=[{"id": "run1", "mode": "images"}]),
+            mock.Mock(data=[]),
+        ]
+
+        runs = w._claim_pending_runs(4)
+        w._claim_pending_runs(4)
+
+        self.assertEqual([r["id"] for r in runs], ["run1"])
+        self.assertTrue(w._claim_rpc_available)
+        self.assertFalse(w._claim_batch_available)
+        sent = [c.args[1] for c in w.supabase.rpc.call_args_list]
+        self.assertEqual(["p_limit" in p for p in sent], [True, False, False])
+        w.supabase.table.assert_not_called()
+
+    def test_empty_queue_returns_no_runs(self) -> None:
+        w = _worker()
+        w.supabase.rpc.return_value.execute.return_value.data = []
+        self.assertEqual(w._claim_pending_runs(), [])
+
+    def test_missing_rpc_falls_back_to_select_update(self) -> None:
+        w = _worker()
+        w.supabase.rpc.return_value.execute.side_effect = APIError(
+            {"code": "PGRST202", "message": "Could not find the function"}
+        )
+        w.supabase.table.return_value.select.return_value.eq.return_value \
+            .not_.in_.return_value.order.return_value.limit.return_value \
+            .execute.return_value.data = []
+
+        self.assertEqual(w._claim_pending_runs(), [])
+        self.assertFalse(w._claim_rpc_available)
+        w.supabase.table.assert_called_with("runs")
+
+        w._claim_pending_runs()
+        w.supabase.rpc.assert_called_once()  # not retried once known missing
+
+    def test_disconnected_listener_returns_to_polling(self) -> None:
+        w = _worker()
+        w.running = True
+        w.listener = mock.MagicMock(connected=False)
+        w.listener.wait.return_value = False
+
+        w._wait_for_pending_run()
+
+        w.listener.wait.assert_called_once_with(worker_module.POLL_INTERVAL_SECONDS)
+
+
+class RunStatusTests(unittest.TestCase):
+    def test_client_status_is_deferred_to_side_writes(self) -> None:
+        w = _worker()
+
+        w._update_run_status("run1", "completed")
+
+        w.supabase.table.assert_called_once_with("runs")
+        update = w.supabase.table.return_value.update
+        self.assertEqual(update.call_args.args[0]["status"], "completed")
+        self.assertTrue(update.call_args.args[0]["completed_at"].endswith("+00:00"))
+        w._side_writes.submit.assert_called_once_with(
+            w._update_client_status, "run1", "completed", None
+        )
+
+    def test_known_client_skips_the_run_lookup(self) -> None:
+        w = _worker()
+
+        w._update_client_status("run1", "completed", "client_x")
+
+        w.supabase.table.assert_called_once_with("clients")
+        update = w.supabase.table.return_value.update
+        self.assertEqual(update.call_args.args[0], {"last_run_status": "completed"})
+        self.assertEqual(update.call_args.kwargs["returning"], ReturnMethod.minimal)
+        update.return_value.eq.assert_called_once_with("id", "client_x")
+
+    def test_unknown_client_is_looked_up_from_the_run(self) -> None:
+        w = _worker()
+        w.supabase.table.return_value.select.return_value.eq.return_value \
+            .single.return_value.execute.return_value.data = {"client_id": "client_y"}
+
+        w._update_client_status("run1", "cancelled")
+
+        self.assertEqual(
+            [c.args[0] for c in w.supabase.table.call_args_list], ["runs", "clients"]
+        )
+        w.supabase.table.return_value.update.return_value.eq.assert_called_once_with(
+            "id", "client_y"
+        )
+
+    def test_failed_run_update_skips_client_update(self) -> None:
+        w = _worker()
+        w.supabase.table.return_value.update.return_value.eq.return_value \
+            .execute.side_effect = RuntimeError("boom")
+
+        w._update_run_status("run1", "failed", error="x")
+
+        w._side_writes.submit.assert_not_called()
+
+
+class LogBatchTests(unittest.TestCase):
+    BATCH = [
+        ("run1", "client1", "grading", "info", "a"),
+        ("run1", "client1", "grading", "warn", "b"),
+    ]
+
+    def test_batch_is_echoed_once_and_inserted(self) -> None:
+        w = _worker()
+        out = io.StringIO()
+        with mock.patch.object(sys, "stdout", out):
+            w._echo_logs(self.BATCH)
+            w._write_logs(self.BATCH)
+
+        self.assertEqual(out.getvalue(), "[grading] [INFO] a\n[grading] [WARN] b\n")
+        rows = w.supabase.table.return_value.insert.call_args.args[0]
+        self.assertEqual([r["message"] for r in rows], ["a", "b"])
+        self.assertEqual({r["client_id"] for r in rows}, {"client1"})
+
+    def test_single_log_looks_up_unknown_client(self) -> None:
+        w = _worker()
+        w.supabase.table.return_value.select.return_value.eq.return_value \
+            .single.return_value.execute.return_value.data = {"client_id": "client_y"}
+
+        w._add_log("run1", "system", "warn", "cancelled")
+
+        row = w.supabase.table.return_value.insert.call_args.args[0]
+        self.assertEqual(row["client_id"], "client_y")
+
+    def test_copy_sink_takes_the_batch_when_configured(self) -> None:
+        w = _worker()
+        w.log_sink = mock.MagicMock()
+        w._write_logs(self.BATCH)
+
+        w.log_sink.write.assert_called_once_with(self.BATCH)
+        w.supabase.table.assert_not_called()
+
+
+def main() -> int:
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite(
+        [
+            loader.loadTestsFromTestCase(FinalizeRunTests),
+            loader.loadTestsFromTestCase(ClaimTests),
+            loader.loadTestsFromTestCase(RunStatusTests),
+            loader.loadTestsFromTestCase(LogBatchTests),
+        ]
+    )
+    result = unittest.TextTestRunner(verbosity=2).run(suite)
+    return 0 if result.wasSuccessful() else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
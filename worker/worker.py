@@ -18,10 +18,14 @@ import sys
 import time
 import signal
 import traceback
-from datetime import datetime
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from typing import Optional
 
 from dotenv import load_dotenv
+from postgrest.exceptions import APIError
+from postgrest.types import ReturnMethod
 from supabase import create_client, Client
 
 # Load environment variables
@@ -32,8 +36,16 @@ from config import (
     SUPABASE_URL,
     SUPABASE_KEY,
     POLL_INTERVAL_SECONDS,
+    POLL_FALLBACK_SECONDS,
+    SUPABASE_DB_URL,
+    MAX_CONCURRENT_RUNS,
+    TEMP_GEN_DAEMON,
 )
-from executors import IngestExecutor, CreativeExecutor, GradingExecutor
+import executors
+from log_copy import COPY_AVAILABLE, CopyLogSink
+from log_writer import LogWriter
+from pool import RunPool
+from run_listener import LISTEN_AVAILABLE, PendingRunListener
 
 
 class Worker:
@@ -43,7 +55,27 @@ class Worker:
         """Initialize the worker with Supabase client."""
         self.supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
         self.running = True
-        self.current_run_id: Optional[str] = None
+        self.pool = RunPool(MAX_CONCURRENT_RUNS)
+        # Logs stream over COPY when a direct DSN is configured
+        self.log_sink: Optional[CopyLogSink] = None
+        if SUPABASE_DB_URL and COPY_AVAILABLE:
+            self.log_sink = CopyLogSink(SUPABASE_DB_URL, fallback=self._add_logs)
+        self.log_writer = LogWriter(self._write_logs, echo=self._echo_logs)
+        # Denormalized writes nothing waits on (clients.last_run_status);
+        # one thread keeps them in order.
+        self._side_writes = ThreadPoolExecutor(max_workers=1, thread_name_prefix="side-writes")
+        # Flipped off if the claim_next_run RPC (migration 025) isn't deployed
+        self._claim_rpc_available = True
+        # ...and its p_limit batch form (migration 027)
+        self._claim_batch_available = True
+        # Likewise for finalize_run (migration 028)
+        self._finalize_rpc_available = True
+        self.listener: Optional[PendingRunListener] = None
+        if SUPABASE_DB_URL:
+            if LISTEN_AVAILABLE:
+                self.listener = PendingRunListener(SUPABASE_DB_URL)
+            else:
+                print("[Worker] SUPABASE_DB_URL set but psycopg not installed — polling")
 
         # Set up signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self._handle_shutdown)
@@ -56,40 +88,88 @@ class Worker:
         print("\n[Worker] Shutdown requested...")
         self.running = False
 
-        # If we're in the middle of a run, mark it as cancelled
-        if self.current_run_id:
+        # Mark any runs we're in the middle of as cancelled
+        for run_id in self.pool.in_flight_ids():
             try:
-                self._update_run_status(self.current_run_id, "cancelled")
-                self._add_log(self.current_run_id, "system", "warn", "Run cancelled due to worker shutdown")
+                self._update_run_status(run_id, "cancelled")
+                self._add_log(run_id, "system", "warn", "Run cancelled due to worker shutdown")
             except Exception as e:
                 print(f"[Worker] Error cancelling run: {e}")
 
-    def _add_log(self, run_id: str, stage: str, level: str, message: str):
-        """Add a log entry to the run_logs table."""
+    def _add_log(
+        self, run_id: str, stage: str, level: str, message: str, client_id: Optional[str] = None
+    ):
+        """Add a log entry to the run_logs table.
+
+        run_logs.client_id is required; pass ``client_id`` when known so it
+        doesn't have to be looked up from the run first.
+        """
         try:
+            if client_id is None:
+                run_result = self.supabase.table("runs").select("client_id").eq("id", run_id).single().execute()
+                client_id = run_result.data["client_id"] if run_result.data else None
             self.supabase.table("run_logs").insert({
                 "run_id": run_id,
+                "client_id": client_id,
                 "stage": stage,
                 "level": level,
                 "message": message,
-            }).execute()
+            }, returning=ReturnMethod.minimal).execute()
         except Exception as e:
             print(f"[Worker] Error adding log: {e}")
 
+    def _echo_logs(self, records: list):
+        """LogWriter echo step: print the batch to stdout once.
+
+        Runs on the log writer thread, so executors never block on console
+        formatting or flushes — one write + flush per batch. Kept apart from
+        _write_logs so a retried store doesn't print the batch twice.
+        """
+        sys.stdout.write("".join(
+            f"[{stage}] [{level.upper()}] {message}\n"
+            for _run_id, _client_id, stage, level, message in records
+        ))
+        sys.stdout.flush()
+
+    def _write_logs(self, records: list):
+        """LogWriter batch callback: store the batch (COPY or PostgREST)."""
+        if self.log_sink:
+            self.log_sink.write(records)
+        else:
+            self._add_logs(records)
+
+    def _add_logs(self, records: list):
+        """Insert a batch of (run_id, client_id, stage, level, message) log records in one call."""
+        self.supabase.table("run_logs").insert([
+            {
+                "run_id": run_id, "client_id": client_id,
+                "stage": stage, "level": level, "message": message,
+            }
+            for run_id, client_id, stage, level, message in records
+        ], returning=ReturnMethod.minimal).execute()
+
     def _update_run_status(
         self,
         run_id: str,
         status: str,
         error: Optional[str] = None,
         hitl_required: bool = False,
+        client_id: Optional[str] = None,
     ):
-        """Update the run status in the runs table."""
+        """Update the run status in the runs table.
+
+        Pass ``client_id`` when known so the client summary update doesn't
+        have to look it up from the run first.
+        """
+        # Sent explicitly so runs keep their timestamps even where the
+        # migration 026 trigger (which only fills them in when omitted)
+        # isn't applied.
         update_data = {"status": status}
 
         if status == "running":
-            update_data["started_at"] = datetime.utcnow().isoformat()
+            update_data["started_at"] = datetime.now(timezone.utc).isoformat()
         elif status in ("completed", "failed", "cancelled", "blocked"):
-            update_data["completed_at"] = datetime.utcnow().isoformat()
+            update_data["completed_at"] = datetime.now(timezone.utc).isoformat()
 
         if error:
             update_data["error"] = error
@@ -98,18 +178,28 @@ class Worker:
             update_data["hitl_required"] = True
 
         try:
-            self.supabase.table("runs").update(update_data).eq("id", run_id).execute()
+            self.supabase.table("runs").update(
+                update_data, returning=ReturnMethod.minimal
+            ).eq("id", run_id).execute()
+        except Exception as e:
+            print(f"[Worker] Error updating run status: {e}")
+            return
+
+        # The run's own status is durable; the client summary can trail it.
+        self._side_writes.submit(self._update_client_status, run_id, status, client_id)
 
-            # Also update the client's last_run_status
-            run_result = self.supabase.table("runs").select("client_id").eq("id", run_id).single().execute()
-            if run_result.data:
-                client_id = run_result.data["client_id"]
+    def _update_client_status(self, run_id: str, status: str, client_id: Optional[str] = None):
+        """Mirror a run's status onto its client's last_run_status."""
+        try:
+            if client_id is None:
+                run_result = self.supabase.table("runs").select("client_id").eq("id", run_id).single().execute()
+                client_id = run_result.data["client_id"] if run_result.data else None
+            if client_id:
                 self.supabase.table("clients").update({
                     "last_run_status": status
-                }).eq("id", client_id).execute()
-
+                }, returning=ReturnMethod.minimal).eq("id", client_id).execute()
         except Exception as e:
-            print(f"[Worker] Error updating run status: {e}")
+            print(f"[Worker] Error updating client status: {e}")
 
     def _upload_to_storage(self, client_id: str, run_id: str, artifact_id: str, local_path: str, file_name: str) -> tuple:
         """Upload a local file to Supabase Storage and return (storage_path, public_url)."""
@@ -151,10 +241,61 @@ class Worker:
         }
         return mime_map.get(ext.lower(), "application/octet-stream")
 
-    def _add_artifact(self, run_id: str, artifact: dict, client_id: Optional[str] = None, campaign_id: Optional[str] = None):
-        """Add an artifact to the artifacts table with optional Storage upload."""
-        import uuid
+    def _finalize_run(
+        self,
+        run_id: str,
+        status: str,
+        error: Optional[str] = None,
+        hitl_required: bool = False,
+        artifacts: Optional[list] = None,
+        client_id: Optional[str] = None,
+        campaign_id: Optional[str] = None,
+    ):
+        """Upload a run's artifacts, then record them and its final status.
+
+        One finalize_run RPC (migration 028) writes the artifacts, the run
+        status and the client's last_run_status in a single transaction.
+        If the RPC is missing or the call fails, the separate bulk insert +
+        status update are used instead so the run is never left running.
+        """
+        rows = [
+            self._artifact_row(run_id, artifact, client_id, campaign_id)
+            for artifact in artifacts or []
+        ]
 
+        if self._finalize_rpc_available:
+            try:
+                self.supabase.rpc("finalize_run", {
+                    "p_run_id": run_id,
+                    "p_status": status,
+                    "p_error": error,
+                    "p_hitl_required": hitl_required,
+                    "p_artifacts": rows,
+                }).execute()
+                return
+            except APIError as e:
+                if e.code in self._RPC_UNAVAILABLE_CODES:
+                    print(f"[Worker] finalize_run RPC unavailable ({e.code}) — using separate writes")
+                    self._finalize_rpc_available = False
+                else:
+                    print(f"[Worker] finalize_run failed, retrying as separate writes: {e}")
+            except Exception as e:
+                print(f"[Worker] finalize_run failed, retrying as separate writes: {e}")
+
+        self._insert_artifacts(rows)
+        self._update_run_status(run_id, status, error, hitl_required, client_id=client_id)
+
+    def _insert_artifacts(self, rows: list):
+        """Record a run's artifact rows with one bulk insert."""
+        if not rows:
+            return
+        try:
+            self.supabase.table("artifacts").insert(rows, returning=ReturnMethod.minimal).execute()
+        except Exception as e:
+            print(f"[Worker] Error adding artifacts: {e}")
+
+    def _artifact_row(self, run_id: str, artifact: dict, client_id: Optional[str], campaign_id: Optional[str]) -> dict:
+        """Upload one artifact (when client_id is known) and build its artifacts row."""
         artifact_id = str(uuid.uuid4())
         local_path = artifact["path"]
         file_name = artifact["name"]
@@ -175,22 +316,19 @@ class Worker:
         except Exception:
             pass
 
-        try:
-            self.supabase.table("artifacts").insert({
-                "id": artifact_id,
-                "run_id": run_id,
-                "client_id": client_id,
-                "campaign_id": campaign_id,
-                "type": artifact["type"],
-                "name": file_name,
-                "path": public_url or local_path,
-                "storage_path": storage_path,
-                "stage": artifact.get("stage"),
-                "size": file_size,
-                "metadata": artifact.get("metadata"),
-            }).execute()
-        except Exception as e:
-            print(f"[Worker] Error adding artifact: {e}")
+        return {
+            "id": artifact_id,
+            "run_id": run_id,
+            "client_id": client_id,
+            "campaign_id": campaign_id,
+            "type": artifact["type"],
+            "name": file_name,
+            "path": public_url or local_path,
+            "storage_path": storage_path,
+            "stage": artifact.get("stage"),
+            "size": file_size,
+            "metadata": artifact.get("metadata"),
+        }
 
     # ADR-004 Phase B: modes the os-api runner owns end-to-end (in-process via
     # setImmediate(executeRun)). The worker MUST NOT claim these — doing so
@@ -200,17 +338,35 @@ class Worker:
     # node loop or restarted process could lose that race.
     OS_API_OWNED_MODES = ("regrade", "stills")
 
-    def _claim_pending_run(self) -> Optional[dict]:
+    # PostgREST "function not found" and Postgres "insufficient privilege":
+    # the RPC isn't usable from here, so claim the old way.
+    _RPC_UNAVAILABLE_CODES = ("PGRST202", "42501")
+
+    def _claim_pending_runs(self, limit: int = 1) -> list:
         """
-        Find and claim a pending run.
+        Find and claim up to ``limit`` pending runs.
 
-        Returns the run data if one was claimed, None otherwise.
+        Returns the claimed runs' data, oldest first (empty if none). Only
+        the RPC path claims more than one per call.
 
         Modes listed in OS_API_OWNED_MODES are skipped — the os-api Express
         runner handles those in-process and the worker has no executor for
         them. Skipping is server-side via .not_.in_("mode", ...) so we don't
         round-trip rows we'll just discard.
         """
+        if self._claim_rpc_available:
+            try:
+                return self._claim_pending_runs_rpc(limit)
+            except APIError as e:
+                if e.code not in self._RPC_UNAVAILABLE_CODES:
+                    print(f"[Worker] Error claiming run: {e}")
+                    return []
+                print(f"[Worker] claim_next_run RPC unavailable ({e.code}) — using SELECT + UPDATE claim")
+                self._claim_rpc_available = False
+            except Exception as e:
+                print(f"[Worker] Error claiming run: {e}")
+                return []
+
         try:
             # Find a pending run NOT in any os-api-owned mode.
             result = self.supabase.table("runs").select("*").eq(
@@ -220,7 +376,7 @@ class Worker:
             ).limit(1).execute()
 
             if not result.data:
-                return None
+                return []
 
             run = result.data[0]
             run_id = run["id"]
@@ -234,31 +390,53 @@ class Worker:
                     f"[Worker] Skipping run {run_id} (mode: {mode}) — "
                     f"os-api owns this mode; worker has no executor."
                 )
-                return None
+                return []
 
             # Attempt to claim it by setting status to running
             # This is a simple approach - in production you'd want a proper lock
             update_result = self.supabase.table("runs").update({
                 "status": "running",
-                "started_at": datetime.utcnow().isoformat(),
+                "started_at": datetime.now(timezone.utc).isoformat(),
             }).eq("id", run_id).eq("status", "pending").execute()
 
             if update_result.data:
                 print(f"[Worker] Claimed run: {run_id} (mode: {mode})")
-                return update_result.data[0]
+                return update_result.data[:1]
             else:
                 # Another worker claimed it
-                return None
+                return []
 
         except Exception as e:
             print(f"[Worker] Error claiming run: {e}")
-            return None
-
-    def _create_log_callback(self, run_id: str):
+            return []
+
+    def _claim_pending_runs_rpc(self, limit: int) -> list:
+        """Claim via claim_next_run (migrations 025/027): one round-trip for
+        up to ``limit`` runs, and concurrent claimers skip each other's rows
+        (FOR UPDATE SKIP LOCKED) instead of racing for the same one."""
+        params = {"p_excluded_modes": list(self.OS_API_OWNED_MODES)}
+        if limit > 1 and self._claim_batch_available:
+            params["p_limit"] = limit
+        try:
+            result = self.supabase.rpc("claim_next_run", params).execute()
+        except APIError as e:
+            if "p_limit" not in params or e.code not in self._RPC_UNAVAILABLE_CODES:
+                raise
+            # 025 without 027: keep the atomic claim, one run per call.
+            print(f"[Worker] claim_next_run has no p_limit ({e.code}) — claiming one run per call")
+            self._claim_batch_available = False
+            single = {"p_excluded_modes": params["p_excluded_modes"]}
+            result = self.supabase.rpc("claim_next_run", single).execute()
+        runs = result.data or []
+        for run in runs:
+            print(f"[Worker] Claimed run: {run['id']} (mode: {run['mode']})")
+        return runs
+
+    def _create_log_callback(self, run_id: str, client_id: str):
         """Create a log callback function for executors."""
         def log_callback(stage: str, level: str, message: str):
-            print(f"[{stage}] [{level.upper()}] {message}")
-            self._add_log(run_id, stage, level, message)
+            # Echoed to stdout by the log writer thread (_echo_logs)
+            self.log_writer.put(run_id, client_id, stage, level, message)
         return log_callback
 
     def _execute_run(self, run: dict):
@@ -267,8 +445,7 @@ class Worker:
         client_id = run["client_id"]
         mode = run["mode"]
 
-        self.current_run_id = run_id
-        log_cb = self._create_log_callback(run_id)
+        log_cb = self._create_log_callback(run_id, client_id)
 
         log_cb("system", "info", f"Starting run: {run_id}")
         log_cb("system", "info", f"Mode: {mode}, Client: {client_id}")
@@ -277,23 +454,23 @@ class Worker:
             result = None
 
             if mode == "ingest":
-                executor = IngestExecutor(log_cb)
+                executor = executors.IngestExecutor(log_cb)
                 result = executor.execute(run_id, client_id)
 
             elif mode == "images":
-                executor = CreativeExecutor(log_cb)
+                executor = executors.CreativeExecutor(log_cb)
                 # For demo, use a default prompt
                 params = {"prompt": "A beautiful minimalist lifestyle scene with natural lighting"}
                 result = executor.execute(run_id, client_id, "images", params)
 
             elif mode == "video":
-                executor = CreativeExecutor(log_cb)
+                executor = executors.CreativeExecutor(log_cb)
                 # For demo, use a default prompt
                 params = {"prompt": "A serene lifestyle moment with soft natural lighting"}
                 result = executor.execute(run_id, client_id, "video", params)
 
             elif mode == "drift":
-                executor = GradingExecutor(log_cb)
+                executor = executors.GradingExecutor(log_cb)
                 result = executor.execute(run_id, client_id)
 
             elif mode == "full":
@@ -302,25 +479,27 @@ class Worker:
 
                 # Ingest
                 log_cb("system", "info", "Stage 1/4: Ingest")
-                ingest_exec = IngestExecutor(log_cb)
+                ingest_exec = executors.IngestExecutor(log_cb)
                 ingest_result = ingest_exec.execute(run_id, client_id)
                 if ingest_result["status"] == "failed":
                     result = ingest_result
                 else:
-                    # Images
-                    log_cb("system", "info", "Stage 2/4: Image Generation")
-                    creative_exec = CreativeExecutor(log_cb)
+                    # Images and video share no inputs or outputs, so video
+                    # runs on a side thread while images run on this one.
+                    creative_exec = executors.CreativeExecutor(log_cb)
                     img_params = {"prompt": "Brand lifestyle hero image"}
-                    img_result = creative_exec.execute(run_id, client_id, "images", img_params)
-
-                    # Video
-                    log_cb("system", "info", "Stage 3/4: Video Generation")
                     vid_params = {"prompt": "Brand story video sequence"}
-                    vid_result = creative_exec.execute(run_id, client_id, "video", vid_params)
+                    log_cb("system", "info", "Stages 2-3/4: Image + Video Generation")
+                    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="full-video") as side:
+                        vid_future = side.submit(
+                            creative_exec.execute, run_id, client_id, "video", vid_params
+                        )
+                        img_result = creative_exec.execute(run_id, client_id, "images", img_params)
+                        vid_result = vid_future.result()
 
                     # Drift check
                     log_cb("system", "info", "Stage 4/4: Brand Drift Check")
-                    grade_exec = GradingExecutor(log_cb)
+                    grade_exec = executors.GradingExecutor(log_cb)
                     grade_result = grade_exec.execute(run_id, client_id)
 
                     # Combine results
@@ -353,13 +532,11 @@ class Worker:
                 hitl_required = result.get("hitl_required", False)
                 artifacts = result.get("artifacts", [])
 
-                # Add artifacts (with Storage upload)
-                campaign_id = run.get("campaign_id")
-                for artifact in artifacts:
-                    self._add_artifact(run_id, artifact, client_id=client_id, campaign_id=campaign_id)
-
-                # Update run status
-                self._update_run_status(run_id, status, error, hitl_required)
+                # Upload artifacts, then record them with the final status
+                self._finalize_run(
+                    run_id, status, error, hitl_required, artifacts,
+                    client_id=client_id, campaign_id=run.get("campaign_id"),
+                )
 
                 log_cb("system", "info", f"Run completed with status: {status}")
                 if artifacts:
@@ -369,33 +546,68 @@ class Worker:
             error_msg = f"Unexpected error: {str(e)}"
             log_cb("system", "error", error_msg)
             traceback.print_exc()
-            self._update_run_status(run_id, "failed", error_msg)
+            self._update_run_status(run_id, "failed", error_msg, client_id=client_id)
+
+    def _wait_for_pending_run(self):
+        """Idle until a run may be claimable.
 
-        finally:
-            self.current_run_id = None
+        With a LISTEN connection, block on notifications (re-checking for
+        shutdown every POLL_INTERVAL_SECONDS) and fall through to a claim
+        attempt after POLL_FALLBACK_SECONDS regardless, to cover anything
+        missed while disconnected. While the connection is down (or without
+        a listener at all), just sleep one poll interval.
+        """
+        if self.listener is None:
+            time.sleep(POLL_INTERVAL_SECONDS)
+            return
+        deadline = time.monotonic() + POLL_FALLBACK_SECONDS
+        while self.running and time.monotonic() < deadline:
+            if self.listener.wait(POLL_INTERVAL_SECONDS):
+                return
+            if not self.listener.connected:
+                return  # no notifications coming; poll on the usual cadence
 
     def run(self):
         """Main worker loop."""
         print("[Worker] Starting worker loop...")
         print(f"[Worker] Polling every {POLL_INTERVAL_SECONDS} seconds")
+        print(f"[Worker] Up to {self.pool.max_workers} concurrent run(s)")
         print("[Worker] Press Ctrl+C to stop\n")
 
+        # Warm Temp-gen interpreters up front so the first creative run
+        # doesn't pay their start-up on its critical path.
+        if TEMP_GEN_DAEMON:
+            executors.CreativeExecutor.prewarm()
+
         while self.running:
             try:
-                # Try to claim a pending run
-                run = self._claim_pending_run()
-
-                if run:
-                    self._execute_run(run)
-                else:
+                # All slots busy — wait for one to free up before claiming
+                free_slots = self.pool.free_slots()
+                if not free_slots:
+                    self.pool.wait_for_slot(POLL_INTERVAL_SECONDS)
+                    continue
+
+                # Claim enough pending runs to fill the free slots
+                runs = self._claim_pending_runs(free_slots)
+
+                for run in runs:
+                    self.pool.submit(run["id"], self._execute_run, run)
+                if not runs:
                     # No pending runs, wait and poll again
-                    time.sleep(POLL_INTERVAL_SECONDS)
+                    self._wait_for_pending_run()
 
             except Exception as e:
                 print(f"[Worker] Error in main loop: {e}")
                 traceback.print_exc()
                 time.sleep(POLL_INTERVAL_SECONDS)
 
+        self.pool.shutdown(wait=True)
+        self._side_writes.shutdown(wait=True)
+        self.log_writer.close()
+        if self.log_sink:
+            self.log_sink.close()
+        if self.listener:
+            self.listener.close()
         print("[Worker] Worker stopped")
 
 